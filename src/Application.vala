@@ -129,6 +129,14 @@ namespace Digger {
             }
         }
 
+        public override void shutdown () {
+            // Write out history saves that are still waiting on their debounce
+            if (query_history != null) {
+                query_history.flush ();
+            }
+            base.shutdown ();
+        }
+
         ~Application () {
             // Cancel timeout on destruction
             if (release_notes_timeout_id > 0) {
@@ -92,52 +92,44 @@ namespace Digger {
             });
         }
     
+    // Release notes parsed from the metainfo file, reused until the file changes
+    private static string? cached_metainfo_path = null;
+    private static uint64 cached_metainfo_mtime = 0;
+    private static string? cached_release_notes = null;
+
     private static void load_release_notes(Adw.AboutDialog about) {
-        try {
-            string[] possible_paths = {
-                Path.build_filename("/app/share/metainfo", @"$(Config.APP_ID).metainfo.xml"),
-                Path.build_filename("/usr/share/metainfo", @"$(Config.APP_ID).metainfo.xml"),
-                Path.build_filename(Environment.get_user_data_dir(), "metainfo", @"$(Config.APP_ID).metainfo.xml")
-            };
-            
-            foreach (string metainfo_path in possible_paths) {
-                var file = File.new_for_path(metainfo_path);
-                
-                if (file.query_exists()) {
-                    uint8[] contents;
-                    string etag_out;
-                    file.load_contents(null, out contents, out etag_out);
-                    string xml_content = (string) contents;
-                    
-                    // Parse the XML to find the release matching Config.VERSION
-                    var parser = new Regex("<release version=\"%s\"[^>]*>(.*?)</release>".printf(Regex.escape_string(Config.VERSION)), 
-                                           RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                    MatchInfo match_info;
-                    
-                    if (parser.match(xml_content, 0, out match_info)) {
-                        string release_section = match_info.fetch(1);
-                        
-                        // Extract description content
-                        var desc_parser = new Regex("<description>(.*?)</description>", 
-                                                    RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                        MatchInfo desc_match;
-                        
-                        if (desc_parser.match(release_section, 0, out desc_match)) {
-                            string release_notes = desc_match.fetch(1).strip();
-                            about.set_release_notes(release_notes);
-                            about.set_release_notes_version(Config.VERSION);
-                        }
-                    }
-                    break;
-                }
-            }
-        } catch (Error e) {
-            // If we can't load release notes from metainfo, that's okay
-            print("Warning: Could not load release notes from metainfo: %s\n", e.message);
+        string? release_notes = find_release_notes();
+        if (release_notes != null) {
+            about.set_release_notes(release_notes);
+            about.set_release_notes_version(Config.VERSION);
         }
     }
     
     public static string get_current_release_notes() {
+        string? release_notes = find_release_notes();
+        if (release_notes == null) {
+            return "";
+        }
+
+        // Convert HTML to plain text for alert dialog
+        release_notes = release_notes.replace("<p>", "").replace("</p>", "\n");
+        release_notes = release_notes.replace("<ul>", "").replace("</ul>", "");
+        release_notes = release_notes.replace("<li>", "• ").replace("</li>", "\n");
+        
+        // Clean up extra whitespace
+        while (release_notes.contains("\n\n\n")) {
+            release_notes = release_notes.replace("\n\n\n", "\n\n");
+        }
+        
+        return release_notes;
+    }
+
+    /**
+     * Returns the description of the current release from the installed
+     * metainfo file, or null if it can't be found. The file is only read and
+     * parsed again when its modification time changes.
+     */
+    private static string? find_release_notes() {
         try {
             string[] possible_paths = {
                 Path.build_filename("/app/share/metainfo", @"$(Config.APP_ID).metainfo.xml"),
@@ -148,49 +140,52 @@ namespace Digger {
             foreach (string metainfo_path in possible_paths) {
                 var file = File.new_for_path(metainfo_path);
                 
-                if (file.query_exists()) {
-                    uint8[] contents;
-                    string etag_out;
-                    file.load_contents(null, out contents, out etag_out);
-                    string xml_content = (string) contents;
+                FileInfo info;
+                try {
+                    info = file.query_info(FileAttribute.TIME_MODIFIED, FileQueryInfoFlags.NONE);
+                } catch (IOError.NOT_FOUND e) {
+                    continue;
+                }
+
+                uint64 mtime = info.get_attribute_uint64(FileAttribute.TIME_MODIFIED);
+                if (metainfo_path == cached_metainfo_path && mtime == cached_metainfo_mtime) {
+                    return cached_release_notes;
+                }
+
+                uint8[] contents;
+                file.load_contents(null, out contents, null);
+                string xml_content = (string) contents;
+                string? release_notes = null;
+                
+                // Parse the XML to find the release matching Config.VERSION
+                var parser = new Regex("<release version=\"%s\"[^>]*>(.*?)</release>".printf(Regex.escape_string(Config.VERSION)), 
+                                       RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
+                MatchInfo match_info;
+                
+                if (parser.match(xml_content, 0, out match_info)) {
+                    string release_section = match_info.fetch(1);
                     
-                    // Parse the XML to find the release matching Config.VERSION
-                    var parser = new Regex("<release version=\"%s\"[^>]*>(.*?)</release>".printf(Regex.escape_string(Config.VERSION)), 
-                                           RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                    MatchInfo match_info;
+                    // Extract description content
+                    var desc_parser = new Regex("<description>(.*?)</description>", 
+                                                RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
+                    MatchInfo desc_match;
                     
-                    if (parser.match(xml_content, 0, out match_info)) {
-                        string release_section = match_info.fetch(1);
-                        
-                        // Extract description content and convert to plain text
-                        var desc_parser = new Regex("<description>(.*?)</description>", 
-                                                    RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                        MatchInfo desc_match;
-                        
-                        if (desc_parser.match(release_section, 0, out desc_match)) {
-                            string release_notes = desc_match.fetch(1).strip();
-                            
-                            // Convert HTML to plain text for alert dialog
-                            release_notes = release_notes.replace("<p>", "").replace("</p>", "\n");
-                            release_notes = release_notes.replace("<ul>", "").replace("</ul>", "");
-                            release_notes = release_notes.replace("<li>", "• ").replace("</li>", "\n");
-                            
-                            // Clean up extra whitespace
-                            while (release_notes.contains("\n\n\n")) {
-                                release_notes = release_notes.replace("\n\n\n", "\n\n");
-                            }
-                            
-                            return release_notes;
-                        }
+                    if (desc_parser.match(release_section, 0, out desc_match)) {
+                        release_notes = desc_match.fetch(1).strip();
                     }
-                    break;
                 }
+
+                cached_metainfo_path = metainfo_path;
+                cached_metainfo_mtime = mtime;
+                cached_release_notes = release_notes;
+                return release_notes;
             }
         } catch (Error e) {
+            // If we can't load release notes from metainfo, that's okay
             print("Warning: Could not load release notes from metainfo: %s\n", e.message);
         }
 
-        return "";
+        return null;
     }
     
     private static void simulate_tab_navigation() {
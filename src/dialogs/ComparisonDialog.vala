@@ -296,7 +296,7 @@ namespace Digger {
                         // Use icon instead of text label for record type
                         string icon_name = get_record_type_icon (record.record_type);
                         var type_icon = new Gtk.Image.from_icon_name (icon_name);
-                        type_icon.tooltip_text = record.record_type.to_string ();
+                        type_icon.tooltip_text = record.record_type_name;
                         record_row.add_prefix (type_icon);
 
                         server_group.add (record_row);
@@ -23,7 +23,6 @@ namespace Digger {
         [GtkChild]
         private unowned Adw.WindowTitle window_title;
 
-        private const string[] RECORD_TYPES = { "A", "AAAA", "CNAME", "MX", "NS", "TXT" };
         private MonitorService service;
         private Gee.ArrayList<Gtk.Widget> rows;
 
@@ -38,7 +37,7 @@ namespace Digger {
         private void on_add_clicked () {
             var entry = new Adw.EntryRow () { title = "Domain" };
             var type_row = new Adw.ComboRow () { title = "Record Type" };
-            type_row.model = new Gtk.StringList (RECORD_TYPES);
+            type_row.model = new Gtk.StringList (DnsPresets.COMMON_RECORD_TYPES);
 
             var group = new Adw.PreferencesGroup ();
             group.add (entry);
@@ -61,7 +60,7 @@ namespace Digger {
                     show_status ("Enter a valid domain.");
                     return;
                 }
-                var record_type = RecordType.from_string (RECORD_TYPES[type_row.selected]);
+                var record_type = RecordType.from_string (DnsPresets.COMMON_RECORD_TYPES[type_row.selected]);
                 if (service.add_watch (domain, record_type)) {
                     show_status ("Now watching %s.".printf (domain));
                 } else {
@@ -81,11 +81,35 @@ namespace Digger {
         private GLib.Settings settings;
         private ThemeManager theme_manager;
         private WhoisService? whois_service = null;
+
+        private uint apply_idle_id = 0;
+
+        // Set while rows are filled from settings, so their change handlers don't write back
+        private bool loading_settings = true;
+
+        // Record types in dropdown order, and each type's row index
+        private Gee.List<RecordTypeInfo> sorted_record_types;
+        private Gee.HashMap<string, int> record_type_positions = new Gee.HashMap<string, int>();
+
+        // Debounced spin row writes: settings key -> pending value / timeout source
+        private Gee.HashMap<string, int> pending_int_values = new Gee.HashMap<string, int>();
+        private Gee.HashMap<string, uint> pending_int_writes = new Gee.HashMap<string, uint>();
         
         public PreferencesDialog(Gtk.Window parent) {
             Object();
             
             settings = new GLib.Settings(Config.APP_ID);
+
+            // Batch changes and apply them together from an idle callback,
+            // so several rows changing in one main loop pass cost a single write
+            settings.delay();
+            settings.notify["has-unapplied"].connect(schedule_settings_apply);
+
+            // Don't lose a value that is still waiting for its debounce
+            closed.connect(() => {
+                flush_pending_int_writes();
+                apply_settings();
+            });
             
             theme_manager = ThemeManager.get_instance();
             
@@ -98,6 +122,7 @@ namespace Digger {
             setup_advanced_settings();
 
             load_settings();
+            loading_settings = false;
         }
         
         private void setup_color_scheme() {
@@ -114,28 +139,13 @@ namespace Digger {
             // Setup record type dropdown using same source as query form
             var string_list = new Gtk.StringList(null);
             var dns_presets = DnsPresets.get_instance();
-            var record_types = dns_presets.get_all_record_types ();
             
-            // Sort by type name for consistent display (same as query form)
-            var sorted_types = new Gee.ArrayList<RecordTypeInfo> ();
-            sorted_types.add_all (record_types);
-            sorted_types.sort ((a, b) => {
-                // Put common types first
-                string[] common_order = {"A", "AAAA", "CNAME", "MX", "NS", "TXT"};
-                int pos_a = -1, pos_b = -1;
-                for (int i = 0; i < common_order.length; i++) {
-                    if (a.record_type == common_order[i]) pos_a = i;
-                    if (b.record_type == common_order[i]) pos_b = i;
-                }
-                
-                if (pos_a >= 0 && pos_b >= 0) return pos_a - pos_b;
-                if (pos_a >= 0) return -1;
-                if (pos_b >= 0) return 1;
-                return strcmp (a.record_type, b.record_type);
-            });
-            
-            foreach (var record_type in sorted_types) {
-                string_list.append(record_type.record_type);
+            // Same order as the query form, shared with load and change handlers
+            sorted_record_types = dns_presets.get_sorted_record_types();
+            for (int i = 0; i < sorted_record_types.size; i++) {
+                var record_type = sorted_record_types[i].record_type;
+                string_list.append(record_type);
+                record_type_positions[record_type] = i;
             }
             
             default_record_type_row.model = string_list;
@@ -156,11 +166,11 @@ namespace Digger {
         }
         
         private void setup_query_behavior() {
-            // Set up switch row connections
-            default_reverse_lookup_row.notify["active"].connect(on_default_reverse_lookup_changed);
-            default_trace_path_row.notify["active"].connect(on_default_trace_path_changed);
-            default_short_output_row.notify["active"].connect(on_default_short_output_changed);
-            auto_clear_form_row.notify["active"].connect(on_auto_clear_form_changed);
+            // Switch rows map one-to-one onto boolean keys, so bind them directly
+            settings.bind("default-reverse-lookup", default_reverse_lookup_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("default-trace-path", default_trace_path_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("default-short-output", default_short_output_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("auto-clear-form", auto_clear_form_row, "active", SettingsBindFlags.DEFAULT);
             
             // Set up timeout spin row
             query_timeout_row.set_range(5, 60);
@@ -169,9 +179,9 @@ namespace Digger {
         
         private void setup_display_options() {
             // Set up display option switch rows
-            show_query_time_row.notify["active"].connect(on_show_query_time_changed);
-            show_ttl_prominent_row.notify["active"].connect(on_show_ttl_prominent_changed);
-            compact_results_row.notify["active"].connect(on_compact_results_changed);
+            settings.bind("show-query-time", show_query_time_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("show-ttl-prominent", show_ttl_prominent_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("compact-results", compact_results_row, "active", SettingsBindFlags.DEFAULT);
         }
         
         private void setup_output_settings() {
@@ -187,46 +197,14 @@ namespace Digger {
             // Load color scheme
             var color_scheme_str = settings.get_string("color-scheme");
             var color_scheme = ColorScheme.from_string(color_scheme_str);
-            switch (color_scheme) {
-                case ColorScheme.SYSTEM:
-                    color_scheme_row.selected = 0;
-                    break;
-                case ColorScheme.LIGHT:
-                    color_scheme_row.selected = 1;
-                    break;
-                case ColorScheme.DARK:
-                    color_scheme_row.selected = 2;
-                    break;
-            }
+            // Rows are listed in ColorScheme order, so the enum value is the row index
+            color_scheme_row.selected = (uint)color_scheme;
             
             // Load default record type using same dynamic list as setup
             var default_record_type = settings.get_string("default-record-type");
             var presets_instance = DnsPresets.get_instance();
-            var record_types = presets_instance.get_all_record_types ();
-            
-            // Sort by type name for consistent display (same as setup)
-            var sorted_types = new Gee.ArrayList<RecordTypeInfo> ();
-            sorted_types.add_all (record_types);
-            sorted_types.sort ((a, b) => {
-                // Put common types first
-                string[] common_order = {"A", "AAAA", "CNAME", "MX", "NS", "TXT"};
-                int pos_a = -1, pos_b = -1;
-                for (int i = 0; i < common_order.length; i++) {
-                    if (a.record_type == common_order[i]) pos_a = i;
-                    if (b.record_type == common_order[i]) pos_b = i;
-                }
-                
-                if (pos_a >= 0 && pos_b >= 0) return pos_a - pos_b;
-                if (pos_a >= 0) return -1;
-                if (pos_b >= 0) return 1;
-                return strcmp (a.record_type, b.record_type);
-            });
-            
-            for (int i = 0; i < sorted_types.size; i++) {
-                if (sorted_types.get(i).record_type == default_record_type) {
-                    default_record_type_row.selected = i;
-                    break;
-                }
+            if (record_type_positions.has_key(default_record_type)) {
+                default_record_type_row.selected = record_type_positions[default_record_type];
             }
             
             // Load default DNS server
@@ -245,73 +223,32 @@ namespace Digger {
             }
             default_dns_server_row.selected = dns_server_index;
             
-            // Load query behavior settings
-            default_reverse_lookup_row.active = settings.get_boolean("default-reverse-lookup");
-            default_trace_path_row.active = settings.get_boolean("default-trace-path");
-            default_short_output_row.active = settings.get_boolean("default-short-output");
-            auto_clear_form_row.active = settings.get_boolean("auto-clear-form");
+            // Load query behavior settings (switch rows are bound in setup)
             query_timeout_row.value = settings.get_int("query-timeout");
             
-            // Load display option settings
-            show_query_time_row.active = settings.get_boolean("show-query-time");
-            show_ttl_prominent_row.active = settings.get_boolean("show-ttl-prominent");
-            compact_results_row.active = settings.get_boolean("compact-results");
-            
             // Load history settings
             query_history_limit_row.value = settings.get_int("query-history-limit");
         }
         
         private void on_color_scheme_changed() {
-            ColorScheme scheme;
-            switch (color_scheme_row.selected) {
-                case 0:
-                    scheme = ColorScheme.SYSTEM;
-                    break;
-                case 1:
-                    scheme = ColorScheme.LIGHT;
-                    break;
-                case 2:
-                    scheme = ColorScheme.DARK;
-                    break;
-                default:
-                    scheme = ColorScheme.SYSTEM;
-                    break;
-            }
+            if (loading_settings) return;
+            var selected = color_scheme_row.selected;
+            var scheme = selected <= (uint)ColorScheme.DARK ? (ColorScheme)selected : ColorScheme.SYSTEM;
             
             theme_manager.set_color_scheme(scheme);
         }
         
         private void on_default_record_type_changed() {
-            // Get dynamic record types using same logic as setup and load
-            var dns_presets = DnsPresets.get_instance();
-            var record_types = dns_presets.get_all_record_types ();
-            
-            // Sort by type name for consistent display
-            var sorted_types = new Gee.ArrayList<RecordTypeInfo> ();
-            sorted_types.add_all (record_types);
-            sorted_types.sort ((a, b) => {
-                // Put common types first
-                string[] common_order = {"A", "AAAA", "CNAME", "MX", "NS", "TXT"};
-                int pos_a = -1, pos_b = -1;
-                for (int i = 0; i < common_order.length; i++) {
-                    if (a.record_type == common_order[i]) pos_a = i;
-                    if (b.record_type == common_order[i]) pos_b = i;
-                }
-                
-                if (pos_a >= 0 && pos_b >= 0) return pos_a - pos_b;
-                if (pos_a >= 0) return -1;
-                if (pos_b >= 0) return 1;
-                return strcmp (a.record_type, b.record_type);
-            });
-            
-            if (default_record_type_row.selected < sorted_types.size) {
-                var selected_type = sorted_types.get((int)default_record_type_row.selected).record_type;
+            if (loading_settings) return;
+            if (default_record_type_row.selected < sorted_record_types.size) {
+                var selected_type = sorted_record_types[(int)default_record_type_row.selected].record_type;
                 settings.set_string("default-record-type", selected_type);
             }
         }
         
         
         private void on_default_dns_server_changed() {
+            if (loading_settings) return;
             if (default_dns_server_row.selected == 0) {
                 // System Default selected
                 settings.set_string("default-dns-server", "");
@@ -328,40 +265,77 @@ namespace Digger {
             }
         }
         
-        private void on_default_reverse_lookup_changed() {
-            settings.set_boolean("default-reverse-lookup", default_reverse_lookup_row.active);
-        }
-        
-        private void on_default_trace_path_changed() {
-            settings.set_boolean("default-trace-path", default_trace_path_row.active);
+        private void on_query_timeout_changed() {
+            schedule_int_write("query-timeout", (int)query_timeout_row.value);
         }
         
-        private void on_default_short_output_changed() {
-            settings.set_boolean("default-short-output", default_short_output_row.active);
+        private void on_history_limit_changed() {
+            schedule_int_write("query-history-limit", (int)query_history_limit_row.value);
         }
-        
-        private void on_auto_clear_form_changed() {
-            settings.set_boolean("auto-clear-form", auto_clear_form_row.active);
+
+        private void schedule_int_write(string key, int value) {
+            if (loading_settings) return;
+
+            pending_int_values[key] = value;
+
+            uint source_id;
+            if (pending_int_writes.unset(key, out source_id)) {
+                Source.remove(source_id);
+            }
+
+            pending_int_writes[key] = Timeout.add(Constants.SETTINGS_WRITE_DEBOUNCE_MS, () => {
+                pending_int_writes.unset(key);
+                write_pending_int(key);
+                return false;
+            });
         }
-        
-        private void on_query_timeout_changed() {
-            settings.set_int("query-timeout", (int)query_timeout_row.value);
+
+        private void write_pending_int(string key) {
+            int value;
+            if (pending_int_values.unset(key, out value)) {
+                settings.set_int(key, value);
+            }
         }
-        
-        private void on_show_query_time_changed() {
-            settings.set_boolean("show-query-time", show_query_time_row.active);
+
+        private void flush_pending_int_writes() {
+            foreach (var source_id in pending_int_writes.values) {
+                Source.remove(source_id);
+            }
+            pending_int_writes.clear();
+
+            foreach (var key in pending_int_values.keys.to_array()) {
+                write_pending_int(key);
+            }
         }
-        
-        private void on_show_ttl_prominent_changed() {
-            settings.set_boolean("show-ttl-prominent", show_ttl_prominent_row.active);
+
+        private void schedule_settings_apply() {
+            if (!settings.has_unapplied || apply_idle_id > 0) {
+                return;
+            }
+
+            apply_idle_id = Idle.add(() => {
+                apply_idle_id = 0;
+                settings.apply();
+                return false;
+            });
         }
-        
-        private void on_compact_results_changed() {
-            settings.set_boolean("compact-results", compact_results_row.active);
+
+        private void apply_settings() {
+            if (apply_idle_id > 0) {
+                Source.remove(apply_idle_id);
+                apply_idle_id = 0;
+            }
+            settings.apply();
         }
-        
-        private void on_history_limit_changed() {
-            settings.set_int("query-history-limit", (int)query_history_limit_row.value);
+
+        ~PreferencesDialog() {
+            // Cancel timeouts on destruction
+            foreach (var source_id in pending_int_writes.values) {
+                Source.remove(source_id);
+            }
+            if (apply_idle_id > 0) {
+                Source.remove(apply_idle_id);
+            }
         }
 
         private void setup_advanced_settings() {
@@ -376,23 +350,12 @@ namespace Digger {
             provider_list.append("Custom");
             doh_provider_row.model = provider_list;
 
-            enable_doh_row.active = settings.get_boolean("enable-doh");
-            enable_dnssec_row.active = settings.get_boolean("enable-dnssec");
-            show_dnssec_details_row.active = settings.get_boolean("show-dnssec-details");
+            settings.bind("enable-doh", enable_doh_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("enable-dnssec", enable_dnssec_row, "active", SettingsBindFlags.DEFAULT);
+            settings.bind("show-dnssec-details", show_dnssec_details_row, "active", SettingsBindFlags.DEFAULT);
             custom_doh_row.text = settings.get_string("custom-doh-endpoint");
 
-            enable_doh_row.notify["active"].connect(() => {
-                settings.set_boolean("enable-doh", enable_doh_row.active);
-                doh_provider_row.sensitive = enable_doh_row.active;
-            });
-
-            enable_dnssec_row.notify["active"].connect(() => {
-                settings.set_boolean("enable-dnssec", enable_dnssec_row.active);
-            });
-
-            show_dnssec_details_row.notify["active"].connect(() => {
-                settings.set_boolean("show-dnssec-details", show_dnssec_details_row.active);
-            });
+            enable_doh_row.bind_property("active", doh_provider_row, "sensitive", BindingFlags.SYNC_CREATE);
 
             custom_doh_row.notify["text"].connect(() => {
                 string endpoint = custom_doh_row.text.strip ();
@@ -421,6 +384,8 @@ namespace Digger {
 
             doh_provider_row.notify["selected"].connect(() => {
                 custom_doh_row.visible = (doh_provider_row.selected == 3);
+                if (loading_settings) return;
+
                 var provider = "";
                 switch (doh_provider_row.selected) {
                     case 0: provider = "cloudflare"; break;
@@ -440,12 +405,11 @@ namespace Digger {
                 default: doh_provider_row.selected = 0; break;
             }
 
-            doh_provider_row.sensitive = enable_doh_row.active;
             custom_doh_row.visible = (doh_provider_row.selected == 3);
 
             // WHOIS settings
             if (auto_whois_lookup_row != null && whois_timeout_row != null && whois_cache_ttl_row != null) {
-                auto_whois_lookup_row.active = settings.get_boolean("auto-whois-lookup");
+                settings.bind("auto-whois-lookup", auto_whois_lookup_row, "active", SettingsBindFlags.DEFAULT);
                 whois_timeout_row.value = settings.get_int("whois-timeout");
                 // Convert seconds to hours for display
                 whois_cache_ttl_row.value = settings.get_int("whois-cache-ttl") / 3600.0;
@@ -454,17 +418,13 @@ namespace Digger {
                 whois_timeout_row.adjustment = new Gtk.Adjustment (30, 5, 120, 5, 10, 0);
                 whois_cache_ttl_row.adjustment = new Gtk.Adjustment (24, 1, 168, 1, 12, 0);
 
-                auto_whois_lookup_row.notify["active"].connect(() => {
-                    settings.set_boolean("auto-whois-lookup", auto_whois_lookup_row.active);
-                });
-
                 whois_timeout_row.notify["value"].connect(() => {
-                    settings.set_int("whois-timeout", (int)whois_timeout_row.value);
+                    schedule_int_write("whois-timeout", (int)whois_timeout_row.value);
                 });
 
                 whois_cache_ttl_row.notify["value"].connect(() => {
                     // Convert hours back to seconds
-                    settings.set_int("whois-cache-ttl", (int)(whois_cache_ttl_row.value * 3600));
+                    schedule_int_write("whois-cache-ttl", (int)(whois_cache_ttl_row.value * 3600));
                 });
 
                 if (clear_whois_cache_row != null) {
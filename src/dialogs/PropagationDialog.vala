@@ -29,12 +29,11 @@ namespace Digger {
         [GtkChild]
         private unowned Gtk.Spinner spinner;
 
-        private const string[] RECORD_TYPES = { "A", "AAAA", "CNAME", "MX", "NS", "TXT" };
         private PropagationService service;
 
         public PropagationDialog (Gtk.Widget? parent) {
             service = new PropagationService ();
-            record_type_dropdown.model = new Gtk.StringList (RECORD_TYPES);
+            record_type_dropdown.model = new Gtk.StringList (DnsPresets.COMMON_RECORD_TYPES);
         }
 
         [GtkCallback]
@@ -43,7 +42,7 @@ namespace Digger {
             if (domain.length == 0) {
                 return;
             }
-            var record_type = RecordType.from_string (RECORD_TYPES[record_type_dropdown.selected]);
+            var record_type = RecordType.from_string (DnsPresets.COMMON_RECORD_TYPES[record_type_dropdown.selected]);
             run_check.begin (domain, record_type);
         }
 
@@ -30,7 +30,10 @@ namespace Digger {
         private QueryHistory query_history;
         private DnsPresets dns_presets;
         private ThemeManager theme_manager;
+        private GLib.Settings settings;
         private bool query_in_progress = false;
+        // The history popover is filled on first show so startup doesn't load history
+        private bool history_list_populated = false;
 
         // Mobile bottom sheet support
         private HistoryDialog? history_dialog = null;
@@ -40,6 +43,8 @@ namespace Digger {
             Object (application: app);
             query_history = history;
 
+            settings = AppSettings.get_instance ();
+
             // Initialize enhanced components
             dns_presets = DnsPresets.get_instance ();
             theme_manager = ThemeManager.get_instance ();
@@ -141,13 +146,10 @@ namespace Digger {
             }
 
             // Get filtered history
-            var history_items = query_history.get_history ();
+            var history_items = search_text != ""
+                ? query_history.search_history (search_text)
+                : query_history.get_history ();
             foreach (var item in history_items) {
-                string record_type_str = item.query_type.to_string ();
-                if (search_text != "" && !item.domain.down ().contains (search_text.down ()) &&
-                    !record_type_str.down ().contains (search_text.down ())) {
-                    continue;
-                }
 
                 var row = create_history_row (item);
                 listbox.append (row);
@@ -252,6 +254,10 @@ namespace Digger {
             // Connect to popover show signal to ensure widgets are enabled
             history_popover.show.connect (() => {
                 debug ("Popover shown - forcing widget sensitivity");
+
+                if (!history_list_populated) {
+                    update_history_list ();
+                }
                 
                 // Force enable immediately when shown
                 Idle.add (() => {
@@ -275,9 +281,6 @@ namespace Digger {
                 });
             });
             
-            // Update history list initially
-            update_history_list ();
-            
             // Force enable history components after everything is connected
             force_enable_history_components ();
             
@@ -378,6 +381,7 @@ namespace Digger {
             }
 
             query_in_progress = true;
+            query_form.query_in_progress = true;
             
             // Use the provided DNS server
             string? server = dns_server;
@@ -400,7 +404,6 @@ namespace Digger {
 
             if (result != null) {
                 // Check if auto-WHOIS lookup is enabled
-                var settings = new GLib.Settings (Config.APP_ID);
                 if (settings.get_boolean ("auto-whois-lookup")) {
                     // Fetch WHOIS data asynchronously (don't block on it)
                     fetch_whois_data.begin (result);
@@ -416,6 +419,7 @@ namespace Digger {
             }
 
             query_in_progress = false;
+            query_form.query_in_progress = false;
         }
 
         private async void fetch_whois_data (QueryResult result) {
@@ -463,6 +467,8 @@ namespace Digger {
         }
 
         private void update_history_list () {
+            history_list_populated = true;
+
             // Clear existing items
             var child = history_listbox.get_first_child ();
             while (child != null) {
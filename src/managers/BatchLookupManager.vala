@@ -27,6 +27,7 @@ namespace Digger {
 
     public class BatchLookupManager : Object {
         private static BatchLookupManager? instance = null;
+        private static Regex? domain_format_regex = null;
         private DnsQuery dns_query;
         private Gee.ArrayList<BatchLookupTask> tasks;
         private bool is_running = false;
@@ -242,11 +243,13 @@ namespace Digger {
                 }
             }
 
-            // Basic format validation
+            // Basic format validation; one pattern compiled once for every batch line
+            // (it also accepts dotted IPv4 addresses)
             try {
-                return Regex.match_simple ("^[a-zA-Z0-9][a-zA-Z0-9.-]*[a-zA-Z0-9]$", domain) ||
-                       Regex.match_simple ("^[a-zA-Z0-9]$", domain) ||
-                       Regex.match_simple ("^([0-9]{1,3}\\.){3}[0-9]{1,3}$", domain); // IPv4
+                if (domain_format_regex == null) {
+                    domain_format_regex = new Regex ("^[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?$", RegexCompileFlags.OPTIMIZE);
+                }
+                return domain_format_regex.match (domain);
             } catch (RegexError e) {
                 return false;
             }
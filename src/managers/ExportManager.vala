@@ -247,7 +247,7 @@ namespace Digger {
                 builder.append ("    {\n");
                 builder.append_printf ("      \"name\": \"%s\",\n", escape_json_string (record.name));
                 builder.append_printf ("      \"ttl\": %d,\n", record.ttl);
-                builder.append_printf ("      \"type\": \"%s\",\n", record.record_type.to_string ());
+                builder.append_printf ("      \"type\": \"%s\",\n", record.record_type_name);
                 builder.append_printf ("      \"value\": \"%s\"", escape_json_string (record.value));
                 if (record.priority >= 0) {
                     builder.append_printf (",\n      \"priority\": %d\n", record.priority);
@@ -287,7 +287,7 @@ namespace Digger {
                 builder.append_printf (",\"%s\",%d,\"%s\",\"%s\",\"%s\",\"%s\",\"%s\"\n",
                     escape_csv (record.name),
                     record.ttl,
-                    record.record_type.to_string (),
+                    record.record_type_name,
                     escape_csv (record.value),
                     escape_csv (whois_registrar),
                     escape_csv (whois_created),
@@ -313,7 +313,7 @@ namespace Digger {
                 builder.append (string.nfill (60, '-') + "\n");
                 foreach (var record in result.answer_section) {
                     builder.append_printf ("%-30s %6d IN %-8s %s\n",
-                        record.name, record.ttl, record.record_type.to_string (), record.value);
+                        record.name, record.ttl, record.record_type_name, record.value);
                 }
                 builder.append ("\n");
             }
@@ -323,7 +323,7 @@ namespace Digger {
                 builder.append (string.nfill (60, '-') + "\n");
                 foreach (var record in result.authority_section) {
                     builder.append_printf ("%-30s %6d IN %-8s %s\n",
-                        record.name, record.ttl, record.record_type.to_string (), record.value);
+                        record.name, record.ttl, record.record_type_name, record.value);
                 }
                 builder.append ("\n");
             }
@@ -333,7 +333,7 @@ namespace Digger {
                 builder.append (string.nfill (60, '-') + "\n");
                 foreach (var record in result.additional_section) {
                     builder.append_printf ("%-30s %6d IN %-8s %s\n",
-                        record.name, record.ttl, record.record_type.to_string (), record.value);
+                        record.name, record.ttl, record.record_type_name, record.value);
                 }
                 builder.append ("\n");
             }
@@ -400,7 +400,7 @@ namespace Digger {
 
             foreach (var record in result.answer_section) {
                 builder.append_printf ("%-30s %6d IN %-8s %s\n",
-                    record.name, record.ttl, record.record_type.to_string (), record.value);
+                    record.name, record.ttl, record.record_type_name, record.value);
             }
 
             return builder.str;
@@ -82,6 +82,10 @@ namespace Digger {
         private Gee.HashMap<string, FavoriteEntry> favorites_map;  // For O(1) lookups
         private File favorites_file;
 
+        // Saves are serialized so an older snapshot can never be renamed over a newer one
+        private bool save_in_progress = false;
+        private bool save_requested = false;
+
         public signal void favorites_updated ();
         public signal void error_occurred (string error_message);
 
@@ -96,20 +100,7 @@ namespace Digger {
             favorites = new Gee.ArrayList<FavoriteEntry> ();
             favorites_map = new Gee.HashMap<string, FavoriteEntry> ();
 
-            var data_dir = File.new_for_path (Environment.get_user_data_dir ())
-                .get_child ("digger");
-
-            try {
-                if (!data_dir.query_exists ()) {
-                    data_dir.make_directory_with_parents ();
-                }
-            } catch (Error e) {
-                // SEC-009: Log full error details, user-facing errors handled elsewhere
-                critical ("Failed to create data directory %s: %s", data_dir.get_path (), e.message);
-                error_occurred ("Failed to initialize favorites storage");
-            }
-
-            favorites_file = data_dir.get_child ("favorites.json");
+            favorites_file = File.new_for_path (Path.build_filename (AppPaths.get_data_dir (), "favorites.json"));
             load_favorites.begin ();
         }
 
@@ -123,7 +114,7 @@ namespace Digger {
                 yield favorites_file.load_contents_async (null, out contents, null);
 
                 var parser = new Json.Parser ();
-                parser.load_from_data ((string) contents);
+                parser.load_from_data ((string) contents, contents.length);
 
                 var root = parser.get_root ();
                 if (root != null && root.get_node_type () == Json.NodeType.ARRAY) {
@@ -151,6 +142,21 @@ namespace Digger {
         }
 
         public async void save_favorites () {
+            if (save_in_progress) {
+                // Picked up by the running save once its write finishes
+                save_requested = true;
+                return;
+            }
+
+            save_in_progress = true;
+            do {
+                save_requested = false;
+                yield write_favorites ();
+            } while (save_requested);
+            save_in_progress = false;
+        }
+
+        private async void write_favorites () {
             try {
                 var generator = new Json.Generator ();
                 var root = new Json.Node (Json.NodeType.ARRAY);
@@ -164,7 +170,7 @@ namespace Digger {
 
                 root.set_array (array);
                 generator.set_root (root);
-                generator.set_pretty (true);
+                generator.set_pretty (false); // Machine-read state file, compact is smaller and faster to write
 
                 string json_data = generator.to_data (null);
                 yield favorites_file.replace_contents_async (
@@ -112,7 +112,7 @@ namespace Digger {
         private PresetManager () {
             system_presets = new Gee.ArrayList<QueryPreset> ();
             user_presets = new Gee.ArrayList<QueryPreset> ();
-            settings = new GLib.Settings (Config.APP_ID);
+            settings = AppSettings.get_instance ();
 
             initialize_default_presets ();
             load_user_presets ();
@@ -249,6 +249,7 @@ namespace Digger {
             }
         }
 
+        // Independent copy of every preset; use the read-only views below for lookups
         public Gee.ArrayList<QueryPreset> get_all_presets () {
             var all_presets = new Gee.ArrayList<QueryPreset> ();
             all_presets.add_all (system_presets);
@@ -256,12 +257,12 @@ namespace Digger {
             return all_presets;
         }
 
-        public Gee.ArrayList<QueryPreset> get_system_presets () {
-            return system_presets;
+        public Gee.List<QueryPreset> get_system_presets () {
+            return system_presets.read_only_view;
         }
 
-        public Gee.ArrayList<QueryPreset> get_user_presets () {
-            return user_presets;
+        public Gee.List<QueryPreset> get_user_presets () {
+            return user_presets.read_only_view;
         }
 
         public QueryPreset? get_preset_by_name (string name) {
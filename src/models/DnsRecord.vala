@@ -27,7 +27,8 @@ namespace Digger {
         HTTPS,
         ANY;
 
-        public string to_string () {
+        // Names are string literals, so callers share them instead of getting copies
+        public unowned string to_string () {
             switch (this) {
                 case A: return "A";
                 case AAAA: return "AAAA";
@@ -50,7 +51,20 @@ namespace Digger {
         }
 
         public static RecordType from_string (string type_str) {
-            switch (type_str.up ()) {
+            // dig prints type names in upper case; only fold case when needed
+            unowned string key = type_str;
+            string? folded = null;
+            for (int i = 0; type_str[i] != '\0'; i++) {
+                if (type_str[i].islower ()) {
+                    folded = type_str.up ();
+                    key = folded;
+                    break;
+                }
+            }
+
+            // Vala matches string cases through a quark lookup, so this is a
+            // single hash lookup rather than a chain of comparisons
+            switch (key) {
                 case "A": return A;
                 case "AAAA": return AAAA;
                 case "CNAME": return CNAME;
@@ -126,7 +140,7 @@ namespace Digger {
         INVALID_DOMAIN,
         NO_DIG_COMMAND;
 
-        public string to_string () {
+        public unowned string to_string () {
             switch (this) {
                 case SUCCESS: return "Success";
                 case NXDOMAIN: return "NXDOMAIN - Domain not found";
@@ -144,6 +158,10 @@ namespace Digger {
     public class DnsRecord : Object {
         public string name { get; set; }
         public RecordType record_type { get; set; }
+        // Shared type name literal; no per-record copy is made
+        public string record_type_name {
+            get { return record_type.to_string (); }
+        }
         public int ttl { get; set; }
         public string value { get; set; }
         public int priority { get; set; default = -1; } // For MX records
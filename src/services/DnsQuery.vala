@@ -15,6 +15,8 @@ namespace Digger {
 
         // Cached dig availability check (SEC-003 Performance)
         private static bool? dig_available_cache = null;
+        // Absolute path of dig once resolved, so each query skips the PATH search
+        private static string? dig_path = null;
 
         private GLib.Settings settings;
         
@@ -31,7 +33,7 @@ namespace Digger {
         }
 
         public DnsQuery () {
-            settings = new GLib.Settings (Config.APP_ID);
+            settings = AppSettings.get_instance ();
         }
 
         public async QueryResult? perform_query (string domain, RecordType record_type, 
@@ -140,50 +142,45 @@ namespace Digger {
 
         private string[] build_dig_command (string domain, RecordType record_type, string? dns_server,
                                           bool reverse_lookup, bool trace_path, bool short_output, bool request_dnssec) {
-            var args = new Gee.ArrayList<string> ();
-            args.add (DIG_COMMAND);
+            // Built straight into the argv array handed to the subprocess
+            string[] args = { dig_path ?? DIG_COMMAND };
 
             // Add DNS server if specified
             if (dns_server != null && dns_server.length > 0) {
-                args.add (@"@$dns_server");
+                args += @"@$dns_server";
             }
 
             // Add domain
-            args.add (domain);
+            args += domain;
 
             // Add record type
             if (!reverse_lookup) {
-                args.add (record_type.to_string ());
+                args += record_type.to_string ();
             }
 
             // Add options
             if (reverse_lookup) {
-                args.add ("-x");
+                args += "-x";
             }
 
             if (trace_path) {
-                args.add ("+trace");
+                args += "+trace";
             }
 
             if (short_output) {
-                args.add ("+short");
+                args += "+short";
             }
 
             if (request_dnssec) {
-                args.add ("+dnssec");
-                args.add ("+nocrypto");
+                args += "+dnssec";
+                args += "+nocrypto";
             }
 
             // Timeout from settings
             var timeout_seconds = (settings != null) ? settings.get_int ("query-timeout") : 10;
-            args.add (@"+time=$timeout_seconds");
+            args += @"+time=$timeout_seconds";
 
-            // Convert to string array safely
-            string[] result_args = new string[args.size];
-            for (int i = 0; i < args.size; i++) {
-                result_args[i] = args[i];
-            }
-            return result_args;
+            return args;
         }
 
         private async bool run_command_async (string[] command_args, out string standard_output,
@@ -300,73 +297,61 @@ namespace Digger {
 
             var lines = output.split ("\n");
             ParseSection current_section = ParseSection.NONE;
-            bool has_section_headers = output.contains ("ANSWER SECTION") || 
-                                      output.contains ("AUTHORITY SECTION") || 
-                                      output.contains ("ADDITIONAL SECTION");
 
-            foreach (string line in lines) {
+            // Single pass: record lines go to the current section, and only
+            // ";;" comment lines are inspected for headers, stats and sections
+            foreach (unowned string line in lines) {
                 string trimmed_line = line.strip ();
-                
+
                 if (trimmed_line.length == 0) {
                     continue;
                 }
 
-                // Parse header status (e.g., "status: NXDOMAIN")
-                if (trimmed_line.has_prefix (";;") && trimmed_line.contains ("->>HEADER<<-")) {
-                    parse_header_status (trimmed_line, result);
+                if (trimmed_line[0] != ';') {
+                    var record = parse_dns_record_line (trimmed_line);
+                    if (record != null) {
+                        switch (current_section) {
+                            case ParseSection.AUTHORITY:
+                                result.authority_section.add (record);
+                                break;
+                            case ParseSection.ADDITIONAL:
+                                result.additional_section.add (record);
+                                break;
+                            default:
+                                // Records before any section header are answers
+                                result.answer_section.add (record);
+                                break;
+                        }
+                    }
                     continue;
                 }
 
-                // Handle query time and other stats
-                if (trimmed_line.has_prefix (";;") && trimmed_line.contains ("Query time:")) {
-                    parse_query_time (trimmed_line, result);
+                // Question lines and other single ';' comments carry nothing we use
+                if (!trimmed_line.has_prefix (";;")) {
                     continue;
                 }
 
-                if (has_section_headers) {
-                    // Check for section headers first (before skipping comments)
-                    if (trimmed_line.contains ("ANSWER SECTION")) {
-                        current_section = ParseSection.ANSWER;
-                        continue;
-                    } else if (trimmed_line.contains ("AUTHORITY SECTION")) {
-                        current_section = ParseSection.AUTHORITY;
-                        continue;
-                    } else if (trimmed_line.contains ("ADDITIONAL SECTION")) {
-                        current_section = ParseSection.ADDITIONAL;
-                        continue;
-                    }
-                    
-                    // Skip other comment lines when we have section headers
-                    if (trimmed_line.has_prefix (";")) {
-                        continue;
-                    }
-                } else {
-                    // Without section headers, assume all DNS records are answers
-                    // unless they contain stats info
-                    if (trimmed_line.has_prefix (";;")) {
-                        continue; // Skip stats lines
-                    }
-                    current_section = ParseSection.ANSWER;
-                }
-
-                // Parse DNS records
-                var record = parse_dns_record_line (trimmed_line);
-                if (record != null) {
-                    switch (current_section) {
-                        case ParseSection.ANSWER:
-                            result.answer_section.add (record);
+                if (trimmed_line.has_suffix ("SECTION:")) {
+                    switch (trimmed_line) {
+                        case ";; ANSWER SECTION:":
+                            current_section = ParseSection.ANSWER;
                             break;
-                        case ParseSection.AUTHORITY:
-                            result.authority_section.add (record);
+                        case ";; AUTHORITY SECTION:":
+                            current_section = ParseSection.AUTHORITY;
                             break;
-                        case ParseSection.ADDITIONAL:
-                            result.additional_section.add (record);
+                        case ";; ADDITIONAL SECTION:":
+                            current_section = ParseSection.ADDITIONAL;
                             break;
-                        case ParseSection.NONE:
-                            // Default section - add to answer
-                            result.answer_section.add (record);
+                        default:
+                            // QUESTION and OPT PSEUDOSECTION hold no records to keep
+                            current_section = ParseSection.NONE;
                             break;
                     }
+                } else if (trimmed_line.has_prefix (";; ->>HEADER<<-")) {
+                    // Parse header status (e.g., "status: NXDOMAIN")
+                    parse_header_status (trimmed_line, result);
+                } else if (trimmed_line.has_prefix (";; Query time:")) {
+                    parse_query_time (trimmed_line, result);
                 }
             }
         }
@@ -383,83 +368,74 @@ namespace Digger {
         }
 
         private DnsRecord? parse_dns_record_line (string line) {
-            var parts = line.split_set (" \t");
-            var clean_parts = new Gee.ArrayList<string> ();
-
-            // Remove empty parts
-            foreach (string part in parts) {
-                if (part.strip ().length > 0) {
-                    clean_parts.add (part.strip ());
+            // Tokenize only the four leading fields (name, TTL, class, type); the
+            // rest of the line is the value, taken as one substring
+            int length = line.length;
+            int pos = 0;
+            string[] fields = new string[Constants.MIN_DNS_RECORD_FIELDS_BASIC];
+            int field_count = 0;
+            while (field_count < fields.length) {
+                string? field = next_record_field (line, length, ref pos);
+                if (field == null) {
+                    break;
                 }
+                fields[field_count++] = field;
+            }
+            skip_record_whitespace (line, length, ref pos);
+            if (pos < length) {
+                field_count++; // The value
             }
 
             // SEC-004: Enhanced bounds checking - minimum 5 fields expected:
             // name, TTL, class (IN), type, value
-            if (clean_parts.size < Constants.MIN_DNS_RECORD_FIELDS) {
-                if (clean_parts.size > 0) {
+            if (field_count < Constants.MIN_DNS_RECORD_FIELDS) {
+                if (field_count > 0) {
                     warning ("Skipping malformed DNS record line (insufficient fields): %s", line);
                 }
                 return null;
             }
 
-            // SEC-004: Safe array access with bounds checking
-            string name = clean_parts[0];
-            string ttl_str = clean_parts[1];
-            // clean_parts[2] is typically class (IN, CH, etc.) - skip it
-            string type_str = clean_parts[3];
+            string name = fields[0];
+            string ttl_str = fields[1];
+            // fields[2] is typically class (IN, CH, etc.) - skip it
+            string type_str = fields[3];
 
             int ttl = int.parse (ttl_str);
             RecordType record_type = RecordType.from_string (type_str);
-
-            // SEC-004: Get the value (everything after the record type) with bounds check
-            var value_parts = new Gee.ArrayList<string> ();
-            if (clean_parts.size > 4) {
-                for (int i = 4; i < clean_parts.size; i++) {
-                    value_parts.add (clean_parts[i]);
-                }
-            }
-
-            // Convert to string array safely
-            string[] value_array = new string[value_parts.size];
-            for (int i = 0; i < value_parts.size; i++) {
-                value_array[i] = value_parts[i];
-            }
-            string value = string.joinv (" ", value_array);
+            string value = line.substring (pos);
 
             // SEC-004: Handle MX records specially for priority with bounds checking
             int priority = -1;
             if (record_type == RecordType.MX) {
-                if (clean_parts.size >= 5) {
-                    priority = int.parse (clean_parts[4]);
-                    value_parts.clear ();
-
-                    // SEC-004: Bounds check before accessing index 5
-                    if (clean_parts.size >= 6) {
-                        for (int i = 5; i < clean_parts.size; i++) {
-                            value_parts.add (clean_parts[i]);
-                        }
-                        // Convert to string array safely
-                        string[] mx_value_array = new string[value_parts.size];
-                        for (int i = 0; i < value_parts.size; i++) {
-                            mx_value_array[i] = value_parts[i];
-                        }
-                        value = string.joinv (" ", mx_value_array);
-                    } else {
-                        // Malformed MX record - has priority but no hostname
-                        warning ("Skipping malformed MX record (missing hostname): %s", line);
-                        return null;
-                    }
-                } else {
-                    // Malformed MX record - no value at all
-                    warning ("Skipping malformed MX record (no priority/value): %s", line);
+                int value_pos = 0;
+                int value_length = value.length;
+                string? priority_str = next_record_field (value, value_length, ref value_pos);
+                skip_record_whitespace (value, value_length, ref value_pos);
+
+                if (value_pos >= value_length) {
+                    // Malformed MX record - has priority but no hostname
+                    warning ("Skipping malformed MX record (missing hostname): %s", line);
                     return null;
                 }
+                priority = int.parse (priority_str);
+                value = value.substring (value_pos);
             }
 
             var record = new DnsRecord (name, record_type, ttl, value, priority);
 
-            // Parse RRSIG specific fields
-            if (record_type == RecordType.RRSIG && value_parts.size >= 8) {
+            // Parse RRSIG specific fields; rdata fields may be separated by runs of
+            // blanks, so they are tokenized the same way as the leading fields
+            string[] value_parts = {};
+            if (record_type == RecordType.RRSIG) {
+                int value_pos = 0;
+                int value_length = value.length;
+                string? part;
+                while (value_parts.length < 8 &&
+                       (part = next_record_field (value, value_length, ref value_pos)) != null) {
+                    value_parts += part;
+                }
+            }
+            if (value_parts.length >= 8) {
                 record.rrsig_type_covered = value_parts[0];
                 record.rrsig_algorithm = value_parts[1];
                 record.rrsig_labels = value_parts[2];
@@ -468,65 +444,88 @@ namespace Digger {
                 record.rrsig_inception = value_parts[5];
                 record.rrsig_key_tag = value_parts[6];
                 record.rrsig_signer_name = value_parts[7];
-                // Signature is in value_parts[8] and onwards
+                // The signature follows the signer name in the value
             }
 
             return record;
         }
 
+        private static void skip_record_whitespace (string line, int length, ref int pos) {
+            while (pos < length && (line[pos] == ' ' || line[pos] == '\t')) {
+                pos++;
+            }
+        }
+
+        // Returns the whitespace-delimited field at pos and advances past it
+        private static string? next_record_field (string line, int length, ref int pos) {
+            skip_record_whitespace (line, length, ref pos);
+            if (pos >= length) {
+                return null;
+            }
+
+            int start = pos;
+            while (pos < length && line[pos] != ' ' && line[pos] != '\t') {
+                pos++;
+            }
+            return line.substring (start, pos - start);
+        }
+
         private void parse_header_status (string line, QueryResult result) {
             // Example: ";; ->>HEADER<<- opcode: QUERY, status: NXDOMAIN, id: 49919"
-            if (line.contains ("status:")) {
-                var parts = line.split ("status:");
-                if (parts.length >= 2) {
-                    var status_part = parts[1].strip ();
-                    var status_components = status_part.split (",");
-                    if (status_components.length >= 1) {
-                        string status = status_components[0].strip ().down ();
-                        
-                        switch (status) {
-                            case "nxdomain":
-                                result.status = QueryStatus.NXDOMAIN;
-                                break;
-                            case "servfail":
-                                result.status = QueryStatus.SERVFAIL;
-                                break;
-                            case "noerror":
-                                result.status = QueryStatus.SUCCESS;
-                                break;
-                            case "refused":
-                                result.status = QueryStatus.REFUSED;
-                                break;
-                            case "formerr":
-                                result.status = QueryStatus.NETWORK_ERROR;
-                                break;
-                            case "notimpl":
-                                result.status = QueryStatus.NETWORK_ERROR;
-                                break;
-                            default:
-                                // Keep existing status if unknown
-                                break;
-                        }
-                    }
-                }
+            int start = line.index_of ("status:");
+            if (start < 0) {
+                return;
+            }
+            start += "status:".length;
+
+            int end = line.index_of_char (',', start);
+            string status = (end < 0 ? line.substring (start) : line.substring (start, end - start)).strip ().down ();
+
+            switch (status) {
+                case "nxdomain":
+                    result.status = QueryStatus.NXDOMAIN;
+                    break;
+                case "servfail":
+                    result.status = QueryStatus.SERVFAIL;
+                    break;
+                case "noerror":
+                    result.status = QueryStatus.SUCCESS;
+                    break;
+                case "refused":
+                    result.status = QueryStatus.REFUSED;
+                    break;
+                case "formerr":
+                    result.status = QueryStatus.NETWORK_ERROR;
+                    break;
+                case "notimpl":
+                    result.status = QueryStatus.NETWORK_ERROR;
+                    break;
+                default:
+                    // Keep existing status if unknown
+                    break;
             }
         }
 
         private void parse_query_time (string line, QueryResult result) {
             // Example: ";; Query time: 23 msec"
-            var parts = line.split (":");
-            if (parts.length >= 2) {
-                var time_part = parts[1].strip ();
-                var time_parts = time_part.split (" ");
-                if (time_parts.length >= 1) {
-                    result.query_time_ms = double.parse (time_parts[0]);
-                }
+            int start = line.index_of_char (':');
+            if (start >= 0) {
+                // double.parse skips leading blanks and stops at " msec"
+                result.query_time_ms = double.parse (line.offset (start + 1));
             }
         }
 
         private QueryStatus parse_dig_error (string stdout, string stderr) {
-            string combined = stdout + " " + stderr;
-            string lower_combined = combined.down ();
+            // dig reports failures on stderr or in ";;" comment lines, so only those are
+            // searched; record data (e.g. a host named "timeout") can't cause a false match
+            var combined = new StringBuilder (stderr.down ());
+            foreach (unowned string line in stdout.split ("\n")) {
+                if (line.has_prefix (";;")) {
+                    combined.append_c (' ');
+                    combined.append (line.down ());
+                }
+            }
+            unowned string lower_combined = combined.str;
 
             if (lower_combined.contains ("nxdomain")) {
                 return QueryStatus.NXDOMAIN;
@@ -541,7 +540,7 @@ namespace Digger {
 
         /**
          * Checks if dig command is available with session-level caching
-         * Performance: Eliminates repeated 'which' system calls
+         * Performance: Resolves dig on PATH in-process instead of spawning 'which'
          */
         private async bool check_dig_available_async () {
             // Check cache first - O(1) return if already checked
@@ -549,40 +548,37 @@ namespace Digger {
                 return dig_available_cache;
             }
 
-            // Perform async check if cache is empty
-            try {
-                string standard_output;
-                string standard_error;
-                int exit_status;
-
-                yield run_command_async ({"which", DIG_COMMAND},
-                                        out standard_output,
-                                        out standard_error,
-                                        out exit_status);
+            dig_path = Environment.find_program_in_path (DIG_COMMAND);
 
-                // Cache the result for session lifetime
-                dig_available_cache = (exit_status == 0);
+            // Cache the result for session lifetime
+            dig_available_cache = (dig_path != null);
 
-                if (dig_available_cache) {
-                    message ("dig command found and cached");
-                } else {
-                    warning ("dig command not found");
-                }
-
-                return dig_available_cache;
-            } catch (Error e) {
-                // Cache negative result
-                dig_available_cache = false;
-                warning ("Error checking dig availability: %s", e.message);
-                return false;
+            if (dig_available_cache) {
+                message ("dig command found at %s and cached", dig_path);
+            } else {
+                warning ("dig command not found");
             }
+
+            return dig_available_cache;
         }
 
         private bool is_valid_domain (string domain) {
             // SEC-003: Simplified validation relying on GLib's IDN conversion
             // This ensures robust support for IDNs while blocking command injection
             
-            if (domain.length == 0) return false;
+            if (domain.length == 0 || domain.length > Constants.MAX_DOMAIN_LENGTH) return false;
+
+            // Cheap rejections first so oversized or pasted garbage never
+            // reaches the IDN conversion and regex matching below ("." alone is the root zone)
+            if (domain[0] == '-' || (domain[0] == '.' && domain.length > 1)) {
+                message ("Rejected domain '%s': starts with hyphen or dot", domain);
+                return false;
+            }
+
+            if (ValidationUtils.contains_whitespace (domain)) {
+                message ("Rejected domain '%s': contains whitespace", domain);
+                return false;
+            }
 
             // Convert to ASCII (Punycode) for validation
             // This handles IDN and basic length checks implicit in the conversion
@@ -591,24 +587,13 @@ namespace Digger {
                 // Fallback: If GLib conversion fails (e.g. missing locales in Flatpak), 
                 // we perform a "permissive but safe" check to allow the query to proceed.
                 // We let 'dig' determine validity, but we MUST prevent command injection.
-                
-                // 1. Check for command injection/flag indicators
-                if (domain.has_prefix ("-")) {
-                    message ("Rejected domain '%s': starts with hyphen", domain);
-                    return false;
-                }
-                
-                // 2. Check for whitespace (domains cannot have spaces)
-                if (Regex.match_simple ("\\s", domain)) {
-                     message ("Rejected domain '%s': contains whitespace", domain);
-                     return false;
-                }
+                // Leading hyphens and whitespace were already rejected above.
 
-                // 3. Check for shell meta-characters forbidden in strict mode
+                // Check for shell meta-characters forbidden in strict mode
                 // (Though we use exec array which avoids shell, it's good practice)
-                if (Regex.match_simple ("[;&|`$]", domain)) {
-                     message ("Rejected domain '%s': contains shell meta-characters", domain);
-                     return false;
+                if (ValidationUtils.contains_shell_metachar (domain)) {
+                    message ("Rejected domain '%s': contains shell meta-characters", domain);
+                    return false;
                 }
                 
                 message ("Warning: GLib.Hostname.to_ascii failed for '%s'. Allowing permissive fallback.", domain);
@@ -626,13 +611,18 @@ namespace Digger {
             }
             
             // Basic character set check to be safe (alphanumeric, hyphen, dot, underscore)
-            // We use the converted ASCII domain for this check
-            try {
-                // Correct regex: hyphen at the end to avoid range interpretation
-                return Regex.match_simple ("^[a-zA-Z0-9._-]+$", ascii_domain);
-            } catch (RegexError e) {
-                return false; // Should not happen with ASCII
+            // We use the converted ASCII domain for this check. A single linear scan,
+            // so pathological pastes cost no more than their length.
+            if (ascii_domain.length == 0) {
+                return false;
             }
+            for (int i = 0; i < ascii_domain.length; i++) {
+                char c = ascii_domain[i];
+                if (!c.isalnum () && c != '.' && c != '_' && c != '-') {
+                    return false;
+                }
+            }
+            return true;
         }
 
         private enum ParseSection {
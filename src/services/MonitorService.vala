@@ -69,10 +69,9 @@ namespace Digger {
         construct {
             watches = new Gee.ArrayList<MonitorWatch> ();
             dns_query = new DnsQuery ();
-            settings = new GLib.Settings (Config.APP_ID);
+            settings = AppSettings.get_instance ();
 
-            string dir = Path.build_filename (Environment.get_user_data_dir (), "digger");
-            file_path = Path.build_filename (dir, MONITORS_FILE);
+            file_path = Path.build_filename (AppPaths.get_data_dir (), MONITORS_FILE);
             load ();
             reschedule ();
         }
@@ -177,7 +176,7 @@ namespace Digger {
                 file.load_contents (null, out contents, null);
 
                 var parser = new Json.Parser ();
-                parser.load_from_data ((string) contents);
+                parser.load_from_data ((string) contents, contents.length);
                 var root = parser.get_root ();
                 if (root == null || root.get_node_type () != Json.NodeType.ARRAY) {
                     return;
@@ -225,7 +224,7 @@ namespace Digger {
 
                 var generator = new Json.Generator ();
                 generator.set_root (builder.get_root ());
-                generator.pretty = true;
+                generator.pretty = false; // Machine-read state file, compact is smaller and faster to write
                 var file = File.new_for_path (file_path);
                 file.replace_contents (generator.to_data (null).data, null, false,
                                        FileCreateFlags.NONE, null, null);
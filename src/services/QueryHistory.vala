@@ -12,35 +12,36 @@ namespace Digger {
     public class QueryHistory : Object {
         private const string HISTORY_FILE = "query-history.json";
         private const int MAX_HISTORY_SIZE = 100;
+        // Per-entry lower-cased text that search_history matches against
+        private const string SEARCH_KEY = "history-search-key";
 
-        private Gee.ArrayList<QueryResult> history;
+        // Newest first; a linked list makes adding at the head and evicting
+        // from the tail constant time
+        private Gee.LinkedList<QueryResult> history;
         private string history_file_path;
 
+        // History limit from preferences, read once and updated when the setting changes
+        private GLib.Settings settings;
+        private int max_history_size = MAX_HISTORY_SIZE;
+
         // Lazy loading flag - only load history when actually needed
         private bool history_loaded = false;
 
+        // Pending debounced write of the history file
+        private uint save_timeout_id = 0;
+
         public signal void history_updated ();
+        public signal void query_added (QueryResult result);
         public signal void error_occurred (string error_message);
 
         public QueryHistory () {
-            history = new Gee.ArrayList<QueryResult> ();
+            history = new Gee.LinkedList<QueryResult> ();
 
-            // Get user data directory
-            string user_data_dir = Environment.get_user_data_dir ();
-            string app_data_dir = Path.build_filename (user_data_dir, "digger");
-            
-            // Create directory if it doesn't exist
-            try {
-                File dir = File.new_for_path (app_data_dir);
-                if (!dir.query_exists ()) {
-                    dir.make_directory_with_parents ();
-                }
-            } catch (Error e) {
-                warning (@"Failed to create data directory: $(e.message)");
-                error_occurred ("Failed to initialize query history storage");
-            }
-            
-            history_file_path = Path.build_filename (app_data_dir, HISTORY_FILE);
+            history_file_path = Path.build_filename (AppPaths.get_data_dir (), HISTORY_FILE);
+
+            settings = AppSettings.get_instance ();
+            max_history_size = settings.get_int ("query-history-limit");
+            settings.changed["query-history-limit"].connect (on_history_limit_changed);
 
             // Don't load history in constructor - lazy load on first access
             // This improves startup time by 200-500ms
@@ -51,24 +52,75 @@ namespace Digger {
             ensure_history_loaded ();
 
             // Add to beginning of history
-            history.insert (0, result);
+            var entry = create_history_entry (result);
+            history.offer_head (entry);
 
-            // Limit history size
-            while (history.size > MAX_HISTORY_SIZE) {
-                history.remove_at (history.size - 1);
-            }
+            enforce_history_limit ();
             
-            save_history ();
+            schedule_save ();
+            query_added (entry);
             history_updated ();
         }
 
+        // History keeps only what it persists; the raw dig output and WHOIS data
+        // stay with the result shown in the view instead of being pinned per entry
+        private static QueryResult create_history_entry (QueryResult result) {
+            var entry = new QueryResult ();
+            entry.domain = result.domain;
+            entry.query_type = result.query_type;
+            entry.dns_server = result.dns_server;
+            entry.query_time_ms = result.query_time_ms;
+            entry.status = result.status;
+            entry.timestamp = result.timestamp;
+            entry.reverse_lookup = result.reverse_lookup;
+            entry.trace_path = result.trace_path;
+            entry.short_output = result.short_output;
+            entry.request_dnssec = result.request_dnssec;
+
+            // Record lists are never modified once a query has completed, so share them
+            entry.answer_section = result.answer_section;
+            entry.authority_section = result.authority_section;
+            entry.additional_section = result.additional_section;
+            return entry;
+        }
+
+        // Case-folded once per entry so searching doesn't allocate per keystroke;
+        // fields are newline-separated so a match can't span two of them
+        private static unowned string get_search_key (QueryResult result) {
+            unowned string? key = result.get_data<string> (SEARCH_KEY);
+            if (key == null) {
+                string new_key = "%s\n%s\n%s".printf (
+                    result.domain.down (),
+                    result.query_type.to_string ().down (),
+                    (result.dns_server ?? "").down ()
+                );
+                result.set_data<string> (SEARCH_KEY, new_key);
+                key = result.get_data<string> (SEARCH_KEY);
+            }
+            return key;
+        }
+
+        private void on_history_limit_changed () {
+            max_history_size = settings.get_int ("query-history-limit");
+
+            // Entries not loaded yet are trimmed when the next query is added
+            if (history_loaded && history.size > max_history_size) {
+                enforce_history_limit ();
+                schedule_save ();
+                history_updated ();
+            }
+        }
+
+        private void enforce_history_limit () {
+            while (history.size > max_history_size) {
+                history.poll_tail ();
+            }
+        }
+
         public QueryResult? get_last_query () {
             ensure_history_loaded ();
 
-            if (history.size > 0) {
-                return history[0];
-            }
-            return null;
+            return history.peek_head ();
         }
 
         public Gee.List<QueryResult> get_history () {
@@ -83,9 +135,7 @@ namespace Digger {
             string lower_query = query.down ();
             
             foreach (var result in history) {
-                if (result.domain.down ().contains (lower_query) ||
-                    result.query_type.to_string ().down ().contains (lower_query) ||
-                    result.dns_server.down ().contains (lower_query)) {
+                if (get_search_key (result).contains (lower_query)) {
                     results.add (result);
                 }
             }
@@ -97,6 +147,7 @@ namespace Digger {
             // No need to load history just to clear it
             history.clear ();
             history_loaded = true; // Mark as loaded (empty state is valid)
+            cancel_pending_save ();
             save_history ();
             history_updated ();
         }
@@ -114,6 +165,33 @@ namespace Digger {
             history_loaded = true;
         }
 
+        /**
+         * Writes any pending history changes to disk immediately
+         * Called on application shutdown so a debounced save isn't lost
+         */
+        public void flush () {
+            if (save_timeout_id > 0) {
+                cancel_pending_save ();
+                save_history ();
+            }
+        }
+
+        private void schedule_save () {
+            cancel_pending_save ();
+            save_timeout_id = Timeout.add (Constants.HISTORY_SAVE_DELAY_MS, () => {
+                save_timeout_id = 0;
+                save_history ();
+                return false;
+            });
+        }
+
+        private void cancel_pending_save () {
+            if (save_timeout_id > 0) {
+                Source.remove (save_timeout_id);
+                save_timeout_id = 0;
+            }
+        }
+
         private void load_history () {
             try {
                 File file = File.new_for_path (history_file_path);
@@ -134,11 +212,14 @@ namespace Digger {
                     return;
                 }
 
+                // The file is saved newest first, so entries are appended as-is
+                // and anything past the current limit is never parsed
                 Json.Array array = root.get_array ();
-                foreach (var element in array.get_elements ()) {
-                    var result = parse_query_result_from_json (element);
+                uint length = array.get_length ();
+                for (uint i = 0; i < length && history.size < max_history_size; i++) {
+                    var result = parse_query_result_from_json (array.get_element (i));
                     if (result != null) {
-                        history.add (result);
+                        history.offer_tail (result);
                     }
                 }
 
@@ -161,11 +242,21 @@ namespace Digger {
                 Json.Generator generator = new Json.Generator ();
                 Json.Node root = builder.get_root ();
                 generator.set_root (root);
-                generator.pretty = true;
-
-                string json_content = generator.to_data (null);
-                File file = File.new_for_path (history_file_path);
-                file.replace_contents (json_content.data, null, false, FileCreateFlags.NONE, null, null);
+                generator.pretty = false;
+
+                // Written to a temporary file and renamed over the old one, so a crash
+                // leaves either version intact; the rename is done here rather than by
+                // CONSISTENT, which would fsync the temporary file on every save
+                size_t length;
+                string json_content = generator.to_data (out length);
+                string temp_path = history_file_path + ".tmp";
+                FileUtils.set_contents_full (temp_path, json_content, length,
+                                             FileSetContentsFlags.NONE, 0600);
+                if (FileUtils.rename (temp_path, history_file_path) != 0) {
+                    int rename_errno = errno; // unlink below may overwrite errno
+                    FileUtils.unlink (temp_path);
+                    warning (@"Failed to replace history file: $(strerror (rename_errno))");
+                }
 
             } catch (Error e) {
                 warning (@"Failed to save history: $(e.message)");
@@ -187,9 +278,14 @@ namespace Digger {
                 result.query_time_ms = obj.get_double_member ("query_time_ms");
                 result.status = (QueryStatus) obj.get_int_member ("status");
                 
-                // Parse timestamp
-                string timestamp_str = obj.get_string_member ("timestamp");
-                result.timestamp = new DateTime.from_iso8601 (timestamp_str, null);
+                // Parse timestamp; the Unix time written alongside the ISO 8601 string
+                // is cheaper to read back, older files only have the string
+                if (obj.has_member ("timestamp_unix")) {
+                    result.timestamp = new DateTime.from_unix_local (obj.get_int_member ("timestamp_unix"));
+                } else {
+                    string timestamp_str = obj.get_string_member ("timestamp");
+                    result.timestamp = new DateTime.from_iso8601 (timestamp_str, null);
+                }
 
                 // Parse advanced options
                 if (obj.has_member ("reverse_lookup")) {
@@ -258,6 +354,9 @@ namespace Digger {
             
             builder.set_member_name ("timestamp");
             builder.add_string_value (result.timestamp.to_string ());
+
+            builder.set_member_name ("timestamp_unix");
+            builder.add_int_value (result.timestamp.to_unix ());
             
             // Advanced options
             builder.set_member_name ("reverse_lookup");
@@ -288,7 +387,7 @@ namespace Digger {
                 builder.add_string_value (record.name);
                 
                 builder.set_member_name ("type");
-                builder.add_string_value (record.record_type.to_string ());
+                builder.add_string_value (record.record_type_name);
                 
                 builder.set_member_name ("ttl");
                 builder.add_int_value (record.ttl);
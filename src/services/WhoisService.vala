@@ -23,7 +23,7 @@ namespace Digger {
         public signal void query_failed (string error_message);
 
         public WhoisService () {
-            settings = new GLib.Settings (Config.APP_ID);
+            settings = AppSettings.get_instance ();
             cache = new WhoisCache ();
         }
 
@@ -310,7 +310,7 @@ namespace Digger {
         public WhoisCache () {
             cache_map = new Gee.HashMap<string, CacheEntry> ();
             access_order = new Gee.ArrayList<string> ();
-            settings = new GLib.Settings (Config.APP_ID);
+            settings = AppSettings.get_instance ();
         }
 
         public new WhoisData? get (string domain) {
@@ -0,0 +1,32 @@
+/*
+ * digger-vala - DNS lookup tool with GTK interface
+ * Copyright (C) 2024 tobagin
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ */
+
+namespace Digger {
+    /**
+     * Per-user storage locations, resolved once per process.
+     */
+    public class AppPaths : Object {
+        private static string? data_dir = null;
+
+        /**
+         * Returns the application's data directory (history, favorites,
+         * monitors), creating it the first time it is requested.
+         */
+        public static string get_data_dir () {
+            if (data_dir == null) {
+                data_dir = Path.build_filename (Environment.get_user_data_dir (), "digger");
+                if (DirUtils.create_with_parents (data_dir, 0755) != 0) {
+                    critical ("Failed to create data directory %s: %s", data_dir, strerror (errno));
+                }
+            }
+            return data_dir;
+        }
+    }
+}
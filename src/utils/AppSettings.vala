@@ -0,0 +1,27 @@
+/*
+ * digger-vala - DNS lookup tool with GTK interface
+ * Copyright (C) 2024 tobagin
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ */
+
+namespace Digger {
+    /**
+     * Shared GLib.Settings handle for the application schema.
+     * Services, widgets and dialogs read settings through this one instance
+     * instead of each opening its own.
+     */
+    public class AppSettings : Object {
+        private static GLib.Settings? instance = null;
+
+        public static GLib.Settings get_instance () {
+            if (instance == null) {
+                instance = new GLib.Settings (Config.APP_ID);
+            }
+            return instance;
+        }
+    }
+}
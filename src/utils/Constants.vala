@@ -29,6 +29,30 @@ namespace Digger.Constants {
      */
     public const int DROPDOWN_HIDE_DELAY_MS = 150;
 
+    /**
+     * Domain entry validation debounce delay
+     * Collapses a burst of keystrokes into a single validation pass
+     */
+    public const int VALIDATION_DEBOUNCE_MS = 150;
+
+    /**
+     * Window in which an identical query submission is ignored
+     * Swallows double Enter/click submits of the same lookup
+     */
+    public const int DUPLICATE_SUBMIT_WINDOW_MS = 1000;
+
+    /**
+     * Delay before a spin row value is written to settings
+     * Holding +/- or typing a number produces one write instead of one per step
+     */
+    public const int SETTINGS_WRITE_DEBOUNCE_MS = 400;
+
+    /**
+     * Delay before query history is written to disk
+     * Back-to-back queries are saved with a single write
+     */
+    public const int HISTORY_SAVE_DELAY_MS = 2000;
+
     /**
      * Delay between sequential batch operations
      * Prevents overwhelming the system with too many requests
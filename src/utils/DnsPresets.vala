@@ -55,6 +55,11 @@ namespace Digger {
         private static DnsPresets? instance = null;
         private Gee.ArrayList<DnsServer> dns_servers;
         private Gee.HashMap<string, RecordTypeInfo> record_types;
+        private Gee.ArrayList<RecordTypeInfo>? sorted_record_types = null;
+        
+        // Record types listed first in dropdowns, in this order; also the fixed
+        // choice list for dialogs that only offer the common types
+        public const string[] COMMON_RECORD_TYPES = {"A", "AAAA", "CNAME", "MX", "NS", "TXT"};
         
         private DnsPresets () {
             dns_servers = new Gee.ArrayList<DnsServer> ();
@@ -91,6 +96,32 @@ namespace Digger {
             return record_types.values;
         }
         
+        /**
+         * Returns record types in display order: common types first, then alphabetical.
+         * Presets don't change after loading, so the order is computed once.
+         */
+        public Gee.List<RecordTypeInfo> get_sorted_record_types () {
+            if (sorted_record_types == null) {
+                sorted_record_types = new Gee.ArrayList<RecordTypeInfo> ();
+                sorted_record_types.add_all (record_types.values);
+                sorted_record_types.sort (compare_record_types);
+            }
+            return sorted_record_types.read_only_view;
+        }
+        
+        private static int compare_record_types (RecordTypeInfo a, RecordTypeInfo b) {
+            int pos_a = -1, pos_b = -1;
+            for (int i = 0; i < COMMON_RECORD_TYPES.length; i++) {
+                if (a.record_type == COMMON_RECORD_TYPES[i]) pos_a = i;
+                if (b.record_type == COMMON_RECORD_TYPES[i]) pos_b = i;
+            }
+            
+            if (pos_a >= 0 && pos_b >= 0) return pos_a - pos_b;
+            if (pos_a >= 0) return -1;
+            if (pos_b >= 0) return 1;
+            return strcmp (a.record_type, b.record_type);
+        }
+        
         private void load_presets () {
             load_dns_servers ();
             load_record_types ();
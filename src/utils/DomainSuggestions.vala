@@ -73,10 +73,14 @@ namespace Digger {
      */
     public class DomainSuggestionEngine : Object {
         private static DomainSuggestionEngine? instance = null;
+        private static Regex? domain_regex = null;
+        private static Regex? ipv4_regex = null;
         private Gee.HashMap<string, DomainSuggestion> domain_cache;
         private Gee.ArrayList<string> common_tlds;
         private Gee.ArrayList<string> popular_domains;
         private QueryHistory? query_history;
+        // History is read on the first suggestion request, not when it's attached
+        private bool history_seeded = false;
         
         // Configuration
         private int max_suggestions = 10;
@@ -99,8 +103,25 @@ namespace Digger {
         }
         
         public void set_query_history (QueryHistory history) {
+            // Several widgets share this engine and hand it the same history;
+            // seed usage counts once and keep them current as queries are added
+            if (query_history == history) {
+                return;
+            }
+
+            if (query_history != null) {
+                query_history.query_added.disconnect (on_query_added);
+            }
             query_history = history;
-            update_cache_from_history ();
+            query_history.query_added.connect (on_query_added);
+            history_seeded = false;
+        }
+
+        private void on_query_added (QueryResult result) {
+            // Before seeding, the new entry is picked up along with the rest
+            if (history_seeded) {
+                record_domain_usage (result.domain);
+            }
         }
         
         /**
@@ -115,6 +136,10 @@ namespace Digger {
             
             string lower_input = input.down ().strip ();
             
+            if (!history_seeded) {
+                update_cache_from_history ();
+            }
+            
             // 1. History-based suggestions
             add_history_suggestions (suggestions, lower_input);
             
@@ -129,6 +154,17 @@ namespace Digger {
                 add_typo_corrections (suggestions, lower_input);
             }
             
+            // Drop repeated domains (e.g. a TLD guess already in history), keeping
+            // the first one gathered; a hash set keeps this linear
+            var seen_domains = new Gee.HashSet<string> ();
+            var unique_suggestions = new Gee.ArrayList<DomainSuggestion> ();
+            foreach (var suggestion in suggestions) {
+                if (seen_domains.add (suggestion.domain)) {
+                    unique_suggestions.add (suggestion);
+                }
+            }
+            suggestions = unique_suggestions;
+            
             // Sort by relevance and frequency
             suggestions.sort ((a, b) => {
                 // Exact matches first
@@ -190,8 +226,8 @@ namespace Digger {
             
             // Basic domain validation
             try {
-                var regex = new Regex ("^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*$");
-                return regex.match (domain);
+                ensure_validation_regexes ();
+                return domain_regex.match (domain);
             } catch (RegexError e) {
                 return false;
             }
@@ -242,6 +278,7 @@ namespace Digger {
         
         private void update_cache_from_history () {
             if (query_history == null) return;
+            history_seeded = true;
             
             var history = query_history.get_history ();
             foreach (var result in history) {
@@ -297,8 +334,13 @@ namespace Digger {
         
         private bool is_ip_address (string input) {
             // Simple check for IPv4
-            if (Regex.match_simple ("^([0-9]{1,3}\\.){3}[0-9]{1,3}$", input)) {
-                return true;
+            try {
+                ensure_validation_regexes ();
+                if (ipv4_regex.match (input)) {
+                    return true;
+                }
+            } catch (RegexError e) {
+                warning ("IPv4 check regex error: %s", e.message);
             }
             
             // Simple check for IPv6 (contains colons)
@@ -309,6 +351,16 @@ namespace Digger {
             return false;
         }
         
+        // Compiled once and shared; TLD suggestions validate a domain per keystroke
+        private static void ensure_validation_regexes () throws RegexError {
+            if (domain_regex == null) {
+                domain_regex = new Regex ("^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*$", RegexCompileFlags.OPTIMIZE);
+            }
+            if (ipv4_regex == null) {
+                ipv4_regex = new Regex ("^([0-9]{1,3}\\.){3}[0-9]{1,3}$", RegexCompileFlags.OPTIMIZE);
+            }
+        }
+        
         private int edit_distance (string a, string b) {
             int len_a = a.length;
             int len_b = b.length;
@@ -44,6 +44,8 @@ namespace Digger {
         private static ThemeManager? instance = null;
         private Adw.StyleManager style_manager;
         private GLib.Settings settings;
+        private ColorScheme pending_scheme = ColorScheme.SYSTEM;
+        private uint apply_idle_id = 0;
         
         public signal void theme_changed(ColorScheme scheme);
         
@@ -52,7 +54,7 @@ namespace Digger {
             
             // Set up settings
             try {
-                settings = new GLib.Settings(Config.APP_ID);
+                settings = AppSettings.get_instance();
                 var stored_theme = settings.get_string("color-scheme");
                 apply_theme(ColorScheme.from_string(stored_theme));
             } catch (Error e) {
@@ -69,8 +71,6 @@ namespace Digger {
         }
         
         public void set_color_scheme(ColorScheme scheme) {
-            apply_theme(scheme);
-            
             // Save to settings
             try {
                 settings.set_string("color-scheme", scheme.to_string());
@@ -78,7 +78,17 @@ namespace Digger {
                 warning("Could not save theme setting: %s", e.message);
             }
             
-            theme_changed(scheme);
+            // Restyling the whole UI is expensive, so apply it from idle and only
+            // for the last scheme picked (e.g. when arrowing through the combo row)
+            pending_scheme = scheme;
+            if (apply_idle_id == 0) {
+                apply_idle_id = Idle.add(() => {
+                    apply_idle_id = 0;
+                    apply_theme(pending_scheme);
+                    theme_changed(pending_scheme);
+                    return false;
+                }, Priority.DEFAULT_IDLE);
+            }
         }
         
         private void apply_theme(ColorScheme scheme) {
@@ -9,6 +9,10 @@
  */
 
 namespace Digger.ValidationUtils {
+    // Address patterns are compiled on first use and shared by every call
+    private Regex? ipv4_regex = null;
+    private Regex? ipv6_regex = null;
+
     /**
      * Validates if a string is a valid IPv4 address
      *
@@ -20,10 +24,22 @@ namespace Digger.ValidationUtils {
             return false;
         }
 
+        // Cheap reject before the regex: dotted quads are 7-15 digits and dots
+        if (input.length < 7 || input.length > 15) {
+            return false;
+        }
+        for (int i = 0; i < input.length; i++) {
+            if (!input[i].isdigit () && input[i] != '.') {
+                return false;
+            }
+        }
+
         try {
             // IPv4 pattern: 0-255.0-255.0-255.0-255
-            var regex = new Regex ("^((25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\\.){3}(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])$");
-            return regex.match (input);
+            if (ipv4_regex == null) {
+                ipv4_regex = new Regex ("^((25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\\.){3}(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])$", RegexCompileFlags.OPTIMIZE);
+            }
+            return ipv4_regex.match (input);
         } catch (RegexError e) {
             warning ("IPv4 validation regex error: %s", e.message);
             return false;
@@ -42,12 +58,19 @@ namespace Digger.ValidationUtils {
             return false;
         }
 
+        // Every IPv6 form contains a colon
+        if (input.index_of_char (':') < 0) {
+            return false;
+        }
+
         try {
             // IPv6 full format: 8 groups of 4 hex digits separated by colons
             // Also supports compressed format with :: for consecutive zeros
             // Simplified regex that covers most common IPv6 formats
-            var regex = new Regex ("^(([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\\.){3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\\.){3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$");
-            return regex.match (input);
+            if (ipv6_regex == null) {
+                ipv6_regex = new Regex ("^(([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\\.){3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\\.){3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$", RegexCompileFlags.OPTIMIZE);
+            }
+            return ipv6_regex.match (input);
         } catch (RegexError e) {
             warning ("IPv6 validation regex error: %s", e.message);
             return false;
@@ -96,21 +119,69 @@ namespace Digger.ValidationUtils {
             }
 
             // Label must start and end with alphanumeric
-            unichar first = label.get_char (0);
-            unichar last = label.get_char (label.length - 1);
-
-            if (!first.isalnum () || !last.isalnum ()) {
+            if (!label[0].isalnum () || !label[label.length - 1].isalnum ()) {
                 return false;
             }
 
-            // Label can only contain alphanumeric and hyphens
-            try {
-                var regex = new Regex ("^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$");
-                if (!regex.match (label)) {
+            // Label can only contain ASCII alphanumerics and hyphens
+            for (int i = 1; i < label.length - 1; i++) {
+                char c = label[i];
+                if (!c.isalnum () && c != '-') {
                     return false;
                 }
-            } catch (RegexError e) {
-                warning ("Hostname label validation regex error: %s", e.message);
+            }
+        }
+
+        return true;
+    }
+
+    /**
+     * Validates an ASCII name as something dig can be asked about
+     *
+     * Looser than is_valid_hostname: underscores are allowed so service and
+     * policy names (_dmarc, _sip._tcp) pass, and IPv4 literals are just
+     * all-digit labels.
+     *
+     * Requirements:
+     * - Total length <= 253 characters, optional trailing dot
+     * - Each label 1-63 characters of letters, digits, hyphens and underscores
+     * - Labels don't start or end with a hyphen
+     *
+     * @param input The string to validate
+     * @return true if valid query name, false otherwise
+     */
+    public bool is_valid_query_name (string input) {
+        int length = input.length;
+        if (length == 0 || length > Constants.MAX_DOMAIN_LENGTH) {
+            return false;
+        }
+
+        // "." alone is the root zone
+        if (length == 1 && input[0] == '.') {
+            return true;
+        }
+
+        // A trailing dot is allowed in a FQDN
+        if (input[length - 1] == '.') {
+            length--;
+        }
+
+        int label_start = 0;
+        for (int i = 0; i <= length; i++) {
+            if (i == length || input[i] == '.') {
+                int label_length = i - label_start;
+                if (label_length == 0 || label_length > Constants.MAX_LABEL_LENGTH) {
+                    return false;
+                }
+                if (input[label_start] == '-' || input[i - 1] == '-') {
+                    return false;
+                }
+                label_start = i + 1;
+                continue;
+            }
+
+            char c = input[i];
+            if (!c.isalnum () && c != '-' && c != '_') {
                 return false;
             }
         }
@@ -118,6 +189,44 @@ namespace Digger.ValidationUtils {
         return true;
     }
 
+    /**
+     * Checks a string for ASCII whitespace
+     *
+     * @param input The string to check
+     * @return true if any character is whitespace, false otherwise
+     */
+    public bool contains_whitespace (string input) {
+        for (int i = 0; input[i] != '\0'; i++) {
+            if (input[i].isspace ()) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Checks a string for shell meta-characters [;&|`$]
+     * Queries use an argv array and never a shell, so this is defense in depth
+     *
+     * @param input The string to check
+     * @return true if any character is a shell meta-character, false otherwise
+     */
+    public bool contains_shell_metachar (string input) {
+        for (int i = 0; input[i] != '\0'; i++) {
+            switch (input[i]) {
+                case ';':
+                case '&':
+                case '|':
+                case '`':
+                case '$':
+                    return true;
+                default:
+                    break;
+            }
+        }
+        return false;
+    }
+
     /**
      * Validates if a string is a valid DNS server address
      * Accepts IPv4, IPv6, or hostname
@@ -288,8 +288,7 @@ namespace Digger {
             target_entry.text = suggestion.domain;
             target_entry.set_position (-1); // Move cursor to end
             
-            // Record usage for improved suggestions
-            suggestion_engine.record_domain_usage (suggestion.domain);
+            // Usage is counted once the query completes (QueryHistory.query_added)
             
             // Emit signal before hiding to ensure proper order
             suggestion_selected (suggestion.domain);
@@ -41,24 +41,54 @@ namespace Digger {
         private GLib.Settings settings;
         private QueryPreset? active_preset = null;
         private bool applying_preset = false;
+
+        // Record types in dropdown order, so a selection index maps straight to its type
+        private Gee.List<RecordTypeInfo> record_type_infos = new Gee.ArrayList<RecordTypeInfo> ();
+        private RecordType[] record_type_values = {};
+        private Gee.HashMap<RecordType, int> record_type_positions = new Gee.HashMap<RecordType, int> ();
+
+        // Last stripped domain text seen by the entry's text notification
+        private string last_domain_text = "";
+
+        // Timeout cancellation support for debounced validation
+        private uint validation_timeout_id = 0;
+        private ulong domain_text_handler_id = 0;
+
+        private const string QUERY_BUTTON_LABEL = "Look up DNS records";
+        private const string QUERY_BUTTON_BUSY_LABEL = "Querying...";
+
+        // Last submitted query parameters, used to drop accidental duplicate submits
+        private string? last_submitted_key = null;
+        private int64 last_submitted_time = 0;
+
+        // Inputs disabled while a query runs, collected once in construct
+        private Gtk.Widget[] query_input_widgets;
+
         
         public signal void query_requested (string domain, RecordType record_type, string? dns_server, bool request_dnssec);
         
         public bool query_in_progress { 
             get { return _query_in_progress; }
             set { 
+                if (_query_in_progress == value) {
+                    return; // Nothing to update, avoid re-invalidating the widgets
+                }
                 _query_in_progress = value;
-                domain_entry.sensitive = !value;
-                record_type_dropdown.sensitive = !value;
-                dns_server_dropdown.sensitive = !value;
+                
+                // Update all affected widgets in one pass
+                foreach (unowned Gtk.Widget widget in query_input_widgets) {
+                    widget.sensitive = !value;
+                }
                 
                 if (value) {
-                    query_button.label = "Querying...";
+                    cancel_pending_validation ();
+                    query_button.label = QUERY_BUTTON_BUSY_LABEL;
                     query_button.sensitive = false;
                 } else {
-                    query_button.label = "Look up DNS records";
-                    // Re-validate to set correct button state
+                    query_button.label = QUERY_BUTTON_LABEL;
+                    // Re-run what a debounced validation cancelled at query start would have done
                     validate_input ();
+                    update_favorite_button_state ();
                 }
             }
         }
@@ -68,10 +98,11 @@ namespace Digger {
         }
         
         construct {
-            settings = new GLib.Settings(Config.APP_ID);
+            settings = AppSettings.get_instance();
             favorites_manager = FavoritesManager.get_instance ();
             preset_manager = PresetManager.get_instance ();
             query_button.sensitive = false;
+            query_input_widgets = { domain_entry, record_type_dropdown, dns_server_dropdown };
 
             if (dns_presets != null) {
                 setup_ui ();
@@ -120,27 +151,21 @@ namespace Digger {
         
         private void setup_record_type_dropdown () {
             var model = new Gtk.StringList (null);
-            var record_types = dns_presets.get_all_record_types ();
-            
-            // Sort by type name for consistent display
-            var sorted_types = new Gee.ArrayList<RecordTypeInfo> ();
-            sorted_types.add_all (record_types);
-            sorted_types.sort ((a, b) => {
-                // Put common types first
-                string[] common_order = {"A", "AAAA", "CNAME", "MX", "NS", "TXT"};
-                int pos_a = -1, pos_b = -1;
-                for (int i = 0; i < common_order.length; i++) {
-                    if (a.record_type == common_order[i]) pos_a = i;
-                    if (b.record_type == common_order[i]) pos_b = i;
-                }
-                
-                if (pos_a >= 0 && pos_b >= 0) return pos_a - pos_b;
-                if (pos_a >= 0) return -1;
-                if (pos_b >= 0) return 1;
-                return strcmp (a.record_type, b.record_type);
-            });
             
-            foreach (var record_type in sorted_types) {
+            // Common types first, then alphabetical (order is computed once by DnsPresets)
+            var sorted_types = dns_presets.get_sorted_record_types ();
+            
+            // Cache the display order so lookups don't re-parse the dropdown labels
+            record_type_infos = sorted_types;
+            record_type_values = new RecordType[sorted_types.size];
+            record_type_positions.clear ();
+            for (int i = 0; i < sorted_types.size; i++) {
+                var record_type = sorted_types[i];
+                var value = RecordType.from_string (record_type.record_type);
+                record_type_values[i] = value;
+                if (!record_type_positions.has_key (value)) {
+                    record_type_positions[value] = i;
+                }
                 model.append (record_type.get_display_name ());
             }
             
@@ -148,31 +173,29 @@ namespace Digger {
             record_type_dropdown.model = model;
             
             // Load default record type from settings and find its index
+            record_type_dropdown.selected = get_default_record_type_index ();
+            
+            // Add tooltips based on selection
+            record_type_dropdown.notify["selected"].connect (() => {
+                var index = record_type_dropdown.selected;
+                if (index < record_type_infos.size) {
+                    record_type_dropdown.tooltip_text = record_type_infos[(int) index].get_tooltip_text ();
+                }
+            });
+        }
+
+        private uint get_default_record_type_index () {
             var default_record_type = settings.get_string ("default-record-type");
             if (default_record_type == "") {
                 default_record_type = "A"; // fallback to A if empty
             }
-            int selected_index = 0; // fallback to first item
-            
-            for (uint i = 0; i < model.get_n_items (); i++) {
-                var display_name = model.get_string (i);
-                var type_code = display_name.split (" - ")[0];
-                if (type_code == default_record_type) {
-                    selected_index = (int)i;
-                    break;
+
+            for (int i = 0; i < record_type_infos.size; i++) {
+                if (record_type_infos[i].record_type == default_record_type) {
+                    return i;
                 }
             }
-            record_type_dropdown.selected = selected_index;
-            
-            // Add tooltips based on selection
-            record_type_dropdown.notify["selected"].connect (() => {
-                var selected_name = model.get_string (record_type_dropdown.selected);
-                var type_code = selected_name.split (" - ")[0];
-                var info = dns_presets.get_record_type_info (type_code);
-                if (info != null) {
-                    record_type_dropdown.tooltip_text = info.get_tooltip_text ();
-                }
-            });
+            return 0; // fallback to first item
         }
         
         private void load_default_preferences () {
@@ -318,15 +341,10 @@ namespace Digger {
                 return;
             }
 
-            // Find the preset by name
-            var all_presets = preset_manager.get_all_presets ();
-            QueryPreset? found_preset = null;
-
-            foreach (var preset in all_presets) {
-                if (preset.get_display_name () == selected_text) {
-                    found_preset = preset;
-                    break;
-                }
+            // Find the preset by name without copying the preset lists
+            QueryPreset? found_preset = find_preset_by_display_name (preset_manager.get_system_presets (), selected_text);
+            if (found_preset == null) {
+                found_preset = find_preset_by_display_name (preset_manager.get_user_presets (), selected_text);
             }
 
             if (found_preset != null) {
@@ -334,6 +352,15 @@ namespace Digger {
             }
         }
 
+        private static QueryPreset? find_preset_by_display_name (Gee.List<QueryPreset> presets, string display_name) {
+            foreach (var preset in presets) {
+                if (preset.get_display_name () == display_name) {
+                    return preset;
+                }
+            }
+            return null;
+        }
+
         private void apply_preset (QueryPreset preset) {
             applying_preset = true;
             active_preset = preset;
@@ -423,10 +450,7 @@ namespace Digger {
             query_button.clicked.connect (on_query_requested);
 
             // Real-time validation
-            domain_entry.changed.connect (() => {
-                validate_input ();
-                update_favorite_button_state ();
-            });
+            domain_text_handler_id = domain_entry.notify["text"].connect (on_domain_text_changed);
 
             // Connect autocomplete signals if dropdown exists
             if (autocomplete_dropdown != null) {
@@ -474,6 +498,35 @@ namespace Digger {
             ttl_details_switch.active = value;
         }
         
+        private void on_domain_text_changed () {
+            string domain = domain_entry.text.strip ();
+            if (domain == last_domain_text) {
+                return; // Text notifications repeat (e.g. IM commits) without a real change
+            }
+            last_domain_text = domain;
+
+            // Debounce so a burst of keystrokes results in a single validation pass
+            cancel_pending_validation ();
+            validation_timeout_id = Timeout.add (Constants.VALIDATION_DEBOUNCE_MS, () => {
+                validation_timeout_id = 0;
+                validate_input ();
+                update_favorite_button_state ();
+                return false;
+            });
+        }
+
+        private void cancel_pending_validation () {
+            if (validation_timeout_id > 0) {
+                Source.remove (validation_timeout_id);
+                validation_timeout_id = 0;
+            }
+        }
+
+        ~EnhancedQueryForm () {
+            // Cancel timeout on destruction
+            cancel_pending_validation ();
+        }
+        
         private void validate_input () {
             string domain = domain_entry.text.strip ();
             bool is_valid = domain.length > 0;
@@ -521,6 +574,15 @@ namespace Digger {
                 return false;
             }
             
+            // Fast path: plain ASCII names and IP addresses need no IDN conversion,
+            // but still get the label rules (length, hyphens, character set)
+            if (is_plain_ascii_host (domain_to_check)) {
+                if (domain_to_check.index_of_char (':') >= 0) {
+                    return ValidationUtils.is_valid_ipv6 (domain_to_check);
+                }
+                return ValidationUtils.is_valid_query_name (domain_to_check);
+            }
+            
             // Try IDN conversion first
             string? ascii_input = GLib.Hostname.to_ascii (domain_to_check);
             if (ascii_input == null) {
@@ -532,20 +594,12 @@ namespace Digger {
                 }
                 
                 // 2. Check for whitespace
-                try {
-                    if (Regex.match_simple ("\\s", domain_to_check)) {
-                        return false;
-                    }
-                } catch (RegexError e) {
+                if (ValidationUtils.contains_whitespace (domain_to_check)) {
                     return false;
                 }
-                
-                // 3. Check for shell meta-characters [;&|`$]
-                try {
-                    if (Regex.match_simple ("[;&|`$]", domain_to_check)) {
-                         return false;
-                    }
-                } catch (RegexError e) {
+
+                // 3. Check for shell meta-characters [;&|`$] (same rule DnsQuery applies)
+                if (ValidationUtils.contains_shell_metachar (domain_to_check)) {
                     return false;
                 }
                 
@@ -563,6 +617,16 @@ namespace Digger {
             return true;
         }
         
+        private static bool is_plain_ascii_host (string input) {
+            for (int i = 0; i < input.length; i++) {
+                char c = input[i];
+                if (!c.isalnum () && c != '.' && c != '-' && c != '_' && c != ':') {
+                    return false;
+                }
+            }
+            return true;
+        }
+        
         private void set_dns_server_by_ip (string ip) {
             var model = dns_server_dropdown.model as Gtk.StringList;
             var dns_servers = dns_server_dropdown.get_data<Gee.ArrayList<DnsServer>> ("dns_servers");
@@ -703,6 +767,10 @@ namespace Digger {
         }
         
         private void on_query_requested () {
+            submit_query (false);
+        }
+        
+        private void submit_query (bool force) {
             if (query_in_progress) return;
             
             string domain = domain_entry.text.strip ();
@@ -731,12 +799,20 @@ namespace Digger {
                 domain_entry.text = domain;
             }
             
-            var selected_text = ((Gtk.StringList) record_type_dropdown.model).get_string (record_type_dropdown.selected);
-            string record_type_str = selected_text.split (" - ")[0];
-            RecordType record_type = RecordType.from_string (record_type_str);
+            RecordType record_type = get_record_type ();
             
             string? dns_server = current_dns_server.length > 0 ? current_dns_server : null;
             
+            // Ignore the same lookup submitted again straight away (e.g. Enter then clicking Look up)
+            string submit_key = @"$domain|$(record_type.to_string ())|$(current_dns_server)|$(reverse_lookup_switch.active)|$(trace_path_switch.active)|$(short_output_switch.active)|$(dnssec_switch.active)";
+            int64 now = get_monotonic_time ();
+            if (!force && submit_key == last_submitted_key &&
+                now - last_submitted_time < Constants.DUPLICATE_SUBMIT_WINDOW_MS * 1000) {
+                return;
+            }
+            last_submitted_key = submit_key;
+            last_submitted_time = now;
+            
             query_requested (domain, record_type, dns_server, dnssec_switch.active);
         }
         
@@ -759,20 +835,16 @@ namespace Digger {
         }
         
         public RecordType get_record_type () {
-            var selected_text = ((Gtk.StringList) record_type_dropdown.model).get_string (record_type_dropdown.selected);
-            string record_type_str = selected_text.split (" - ")[0];
-            return RecordType.from_string (record_type_str);
+            var index = record_type_dropdown.selected;
+            if (index >= record_type_values.length) {
+                return RecordType.A;
+            }
+            return record_type_values[index];
         }
         
         public void set_record_type (RecordType record_type) {
-            var model = (Gtk.StringList) record_type_dropdown.model;
-            for (uint i = 0; i < model.get_n_items (); i++) {
-                string item_text = model.get_string (i);
-                string item_type = item_text.split (" - ")[0];
-                if (item_type == record_type.to_string ()) {
-                    record_type_dropdown.selected = i;
-                    break;
-                }
+            if (record_type_positions.has_key (record_type)) {
+                record_type_dropdown.selected = record_type_positions[record_type];
             }
         }
         
@@ -793,26 +865,10 @@ namespace Digger {
         }
         
         public void clear_form () {
-            domain_entry.text = "";
+            reset_domain_text ();
             
             // Reset record type to default from settings
-            var default_record_type = settings.get_string ("default-record-type");
-            if (default_record_type == "") {
-                default_record_type = "A"; // fallback
-            }
-            var model = (Gtk.StringList) record_type_dropdown.model;
-            int selected_index = 0; // fallback to first item
-            
-            for (uint i = 0; i < model.get_n_items (); i++) {
-                var display_name = model.get_string (i);
-                var type_code = display_name.split (" - ")[0];
-                if (type_code == default_record_type) {
-                    selected_index = (int)i;
-                    break;
-                }
-            }
-            
-            record_type_dropdown.selected = selected_index;
+            record_type_dropdown.selected = get_default_record_type_index ();
             
             // Reset DNS server to default from settings
             var default_dns_server = settings.get_string ("default-dns-server");
@@ -840,17 +896,34 @@ namespace Digger {
             dnssec_switch.active = false;
             ttl_details_switch.active = false;
             
+            cancel_pending_validation ();
             validate_input ();
+            update_favorite_button_state ();
         }
         
         public void clear_domain_only () {
             // Clear only the domain field, keep all other settings
-            domain_entry.text = "";
+            reset_domain_text ();
+            cancel_pending_validation ();
             validate_input ();
+            update_favorite_button_state ();
+        }
+        
+        private void reset_domain_text () {
+            // Callers validate once after resetting, so skip the debounced pass
+            if (domain_text_handler_id > 0) {
+                SignalHandler.block (domain_entry, domain_text_handler_id);
+            }
+            domain_entry.text = "";
+            last_domain_text = "";
+            if (domain_text_handler_id > 0) {
+                SignalHandler.unblock (domain_entry, domain_text_handler_id);
+            }
         }
         
         public void trigger_query () {
-            on_query_requested ();
+            // Explicit repeats (Ctrl+R) always go through
+            submit_query (true);
         }
         
         /**
@@ -26,13 +26,33 @@ namespace Digger {
         
         private QueryResult? current_result = null;
         
+        // Holds everything currently shown in content_box, so clearing detaches one widget
+        private Gtk.Box? content_root = null;
+        private uint pulse_timeout_id = 0;
+        
+        // Record rows currently shown, and torn-down rows kept for the next result
+        private Gee.ArrayList<RecordRow> active_rows = new Gee.ArrayList<RecordRow> ();
+        private Gee.ArrayList<RecordRow> row_pool = new Gee.ArrayList<RecordRow> ();
+        private const int ROW_POOL_LIMIT = 128;
+        private Gtk.Box? welcome_box = null;
+        private Gtk.Box? error_box = null;
+        private Gtk.Label? error_label = null;
+        private Gtk.Box? no_results_box = null;
+        
         private DnsPresets dns_presets;
         private GLib.Settings settings;
         
         public bool show_detailed_ttl { get; set; default = false; }
+        
+        // Sections with more records than this are shown in a recycling list view
+        private const int RECORD_LIST_VIEW_THRESHOLD = 50;
+        private const int RECORD_LIST_VIEW_MAX_HEIGHT = 480;
+        
+        // Bundled copy icon, shared by every copy button in the view
+        private const string COPY_ICON_NAME = Config.APP_ID + "-copy-symbolic";
 
         public EnhancedResultView () {
-            settings = new GLib.Settings (Config.APP_ID);
+            settings = AppSettings.get_instance ();
             dns_presets = DnsPresets.get_instance ();
             print (@"EnhancedResultView: dns_presets is $(dns_presets != null ? "not null" : "null")\n");
         }
@@ -83,18 +103,33 @@ namespace Digger {
             progress_bar.visible = true;
             progress_bar.pulse ();
             
-            // Pulse the progress bar
-            Timeout.add (100, () => {
+            // Pulse the progress bar, replacing any pulse left over from a previous query
+            stop_progress_pulse ();
+            pulse_timeout_id = Timeout.add (100, () => {
                 if (progress_bar.visible) {
                     progress_bar.pulse ();
                     return true;
                 }
+                pulse_timeout_id = 0;
                 return false;
             });
         }
         
+        private void stop_progress_pulse () {
+            if (pulse_timeout_id > 0) {
+                Source.remove (pulse_timeout_id);
+                pulse_timeout_id = 0;
+            }
+        }
+        
+        ~EnhancedResultView () {
+            // Cancel timeout on destruction
+            stop_progress_pulse ();
+        }
+        
         public void show_result (QueryResult result) {
             current_result = result;
+            stop_progress_pulse ();
             progress_bar.visible = false;
 
             // Show action buttons when we have a result
@@ -292,65 +327,38 @@ namespace Digger {
         private void show_welcome_message () {
             clear_content ();
             
-            var welcome_box = new Gtk.Box (Gtk.Orientation.VERTICAL, 12) {
-                valign = Gtk.Align.CENTER,
-                halign = Gtk.Align.CENTER
-            };
-            
-            var icon = new Gtk.Image.from_icon_name ("network-workgroup-symbolic") {
-                pixel_size = 64
-            };
-            icon.add_css_class ("dim-label");
-            
-            var title_label = new Gtk.Label ("DNS Lookup Tool") {
-                halign = Gtk.Align.CENTER
-            };
-            title_label.add_css_class ("title-1");
-            
-            var subtitle_label = new Gtk.Label ("Enter a domain name and select a record type to begin") {
-                halign = Gtk.Align.CENTER
-            };
-            subtitle_label.add_css_class ("dim-label");
-            
-            welcome_box.append (icon);
-            welcome_box.append (title_label);
-            welcome_box.append (subtitle_label);
+            if (welcome_box == null) {
+                welcome_box = create_status_box ("network-workgroup-symbolic", "dim-label", "DNS Lookup Tool", "title-1");
+                
+                var subtitle_label = new Gtk.Label ("Enter a domain name and select a record type to begin") {
+                    halign = Gtk.Align.CENTER
+                };
+                subtitle_label.add_css_class ("dim-label");
+                welcome_box.append (subtitle_label);
+            }
             
-            content_box.append (welcome_box);
+            attach_status_box (welcome_box);
             summary_label.label = "";
         }
         
         private void show_error_message (QueryResult result) {
-            var error_box = new Gtk.Box (Gtk.Orientation.VERTICAL, 12) {
-                valign = Gtk.Align.CENTER,
-                halign = Gtk.Align.CENTER
-            };
-            
-            var icon = new Gtk.Image.from_icon_name ("dialog-error-symbolic") {
-                pixel_size = 64
-            };
-            icon.add_css_class ("error");
-            
-            var title_label = new Gtk.Label ("Query Failed") {
-                halign = Gtk.Align.CENTER
-            };
-            title_label.add_css_class ("title-2");
-            
-            var error_label = new Gtk.Label (get_error_description (result.status)) {
-                halign = Gtk.Align.CENTER,
-                wrap = true,
-                justify = Gtk.Justification.CENTER
-            };
-            error_label.add_css_class ("dim-label");
-            
-            error_box.append (icon);
-            error_box.append (title_label);
-            error_box.append (error_label);
+            if (error_box == null) {
+                error_box = create_status_box ("dialog-error-symbolic", "error", "Query Failed", "title-2");
+                
+                error_label = new Gtk.Label (null) {
+                    halign = Gtk.Align.CENTER,
+                    wrap = true,
+                    justify = Gtk.Justification.CENTER
+                };
+                error_label.add_css_class ("dim-label");
+                error_box.append (error_label);
+            }
             
-            content_box.append (error_box);
+            error_label.label = get_error_description (result.status);
+            attach_status_box (error_box);
         }
         
-        private string get_error_description (QueryStatus status) {
+        private unowned string get_error_description (QueryStatus status) {
             switch (status) {
                 case QueryStatus.NXDOMAIN:
                     return "The domain does not exist or cannot be found.";
@@ -372,33 +380,50 @@ namespace Digger {
         }
         
         private void show_no_results_message (QueryResult result) {
-            var no_results_box = new Gtk.Box (Gtk.Orientation.VERTICAL, 12) {
+            if (no_results_box == null) {
+                no_results_box = create_status_box ("dialog-information-symbolic", "dim-label", "No Records Found", "title-2");
+                
+                var info_label = new Gtk.Label ("The query completed successfully but returned no DNS records") {
+                    halign = Gtk.Align.CENTER,
+                    wrap = true,
+                    justify = Gtk.Justification.CENTER
+                };
+                info_label.add_css_class ("dim-label");
+                no_results_box.append (info_label);
+            }
+            
+            attach_status_box (no_results_box);
+        }
+        
+        private Gtk.Box create_status_box (string icon_name, string icon_class, string title, string title_class) {
+            var box = new Gtk.Box (Gtk.Orientation.VERTICAL, 12) {
                 valign = Gtk.Align.CENTER,
                 halign = Gtk.Align.CENTER
             };
             
-            var icon = new Gtk.Image.from_icon_name ("dialog-information-symbolic") {
+            var icon = new Gtk.Image.from_icon_name (icon_name) {
                 pixel_size = 64
             };
-            icon.add_css_class ("dim-label");
+            icon.add_css_class (icon_class);
             
-            var title_label = new Gtk.Label ("No Records Found") {
+            var title_label = new Gtk.Label (title) {
                 halign = Gtk.Align.CENTER
             };
-            title_label.add_css_class ("title-2");
-            
-            var info_label = new Gtk.Label ("The query completed successfully but returned no DNS records") {
-                halign = Gtk.Align.CENTER,
-                wrap = true,
-                justify = Gtk.Justification.CENTER
-            };
-            info_label.add_css_class ("dim-label");
+            title_label.add_css_class (title_class);
             
-            no_results_box.append (icon);
-            no_results_box.append (title_label);
-            no_results_box.append (info_label);
+            box.append (icon);
+            box.append (title_label);
             
-            content_box.append (no_results_box);
+            return box;
+        }
+        
+        private void attach_status_box (Gtk.Box box) {
+            // Status boxes are built once and moved between content roots
+            var parent = box.get_parent () as Gtk.Box;
+            if (parent != null) {
+                parent.remove (box);
+            }
+            content_root.append (box);
         }
         
         private void add_enhanced_results_section (string section_title, Gee.ArrayList<DnsRecord> records, string style_class) {
@@ -408,96 +433,73 @@ namespace Digger {
                 margin_end = 6
             };
             
-            foreach (var record in records) {
-                var record_row = create_enhanced_record_row (record, style_class);
-                section_group.add (record_row);
+            if (records.size > RECORD_LIST_VIEW_THRESHOLD) {
+                // Large sections (ANY, DNSKEY, trace output) recycle rows instead of building one per record
+                section_group.add (create_record_list_view (records, style_class));
+            } else {
+                bool ttl_prominent = settings != null && settings.get_boolean ("show-ttl-prominent");
+                foreach (var record in records) {
+                    var record_row = create_enhanced_record_row (record, style_class, ttl_prominent);
+                    section_group.add (record_row);
+                }
             }
             
-            content_box.append (section_group);
+            content_root.append (section_group);
         }
         
-        private Adw.ActionRow create_enhanced_record_row (DnsRecord record, string style_class) {
-            var row = new Adw.ActionRow ();
-            
-            // Get record type information for enhanced display
-            RecordTypeInfo? type_info = null;
-            if (dns_presets != null) {
-                type_info = dns_presets.get_record_type_info (record.record_type.to_string ());
-            }
-            
-            // Create colored record type badge
-            var type_badge = new Gtk.Label (record.record_type.to_string ()) {
-                halign = Gtk.Align.CENTER,
-                valign = Gtk.Align.CENTER,
-                width_request = 60
-            };
-            type_badge.add_css_class ("pill");
-            type_badge.add_css_class (style_class);
-            
-            // Record name and TTL
-            row.title = record.name;
-            
-            if (record.record_type == RecordType.RRSIG && record.rrsig_type_covered != null) {
-                string exp_date = format_rrsig_date (record.rrsig_expiration);
-                row.subtitle = @"Covers $(record.rrsig_type_covered) • Expires $exp_date • Tag $(record.rrsig_key_tag) • Alg $(record.rrsig_algorithm)";
-            } else if (settings != null && settings.get_boolean ("show-ttl-prominent")) {
-                row.subtitle = @"TTL: $(record.ttl)s";
+        private Adw.ActionRow create_enhanced_record_row (DnsRecord record, string style_class, bool ttl_prominent) {
+            RecordRow row;
+            if (row_pool.size > 0) {
+                row = row_pool.remove_at (row_pool.size - 1);
             } else {
-                row.subtitle = record.value;
+                row = new RecordRow ();
+                row.copy_requested.connect (copy_to_clipboard);
             }
-
-            if (show_detailed_ttl) {
-                string ttl_text = @"TTL: $(record.ttl)s";
-                
-                // If expiration is available (for RRSIG), show it too
-                if (record.record_type == RecordType.RRSIG && record.rrsig_expiration != null) {
-                    // Logic to calculate remaining time could be added here
-                }
-                
-                var ttl_label = new Gtk.Label (ttl_text);
-                ttl_label.add_css_class ("caption");
-                ttl_label.add_css_class ("dim-label");
-                ttl_label.margin_end = 6;
-                row.add_suffix (ttl_label);
+            active_rows.add (row);
+            row.bind (record, style_class, get_record_type_info (record), ttl_prominent, show_detailed_ttl);
+            return row;
+        }
+        
+        private Gtk.Widget create_record_list_view (Gee.ArrayList<DnsRecord> records, string style_class) {
+            var store = new GLib.ListStore (typeof (DnsRecord));
+            foreach (var record in records) {
+                store.append (record);
             }
             
-            // Add record type icon if available
-            if (type_info != null) {
-                var type_icon = new Gtk.Image.from_icon_name (type_info.icon) {
-                    pixel_size = 16
-                };
-                row.add_prefix (type_icon);
-                row.tooltip_text = type_info.get_tooltip_text ();
-            }
+            bool ttl_prominent = settings != null && settings.get_boolean ("show-ttl-prominent");
+            bool detailed_ttl = show_detailed_ttl;
             
-            row.add_prefix (type_badge);
+            var factory = new Gtk.SignalListItemFactory ();
+            factory.setup.connect ((item) => {
+                var row = new RecordRow ();
+                row.copy_requested.connect (copy_to_clipboard);
+                ((Gtk.ListItem) item).child = row;
+            });
+            factory.bind.connect ((item) => {
+                var list_item = (Gtk.ListItem) item;
+                var record = (DnsRecord) list_item.item;
+                ((RecordRow) list_item.child).bind (record, style_class, get_record_type_info (record),
+                                                     ttl_prominent, detailed_ttl);
+            });
             
-            // Value display
-            var value_label = new Gtk.Label (record.get_display_value ()) {
-                halign = Gtk.Align.END,
-                selectable = true,
-                wrap = false,
-                ellipsize = Pango.EllipsizeMode.END,
-                max_width_chars = 80
-            };
-            value_label.add_css_class ("monospace");
+            var list_view = new Gtk.ListView (new Gtk.NoSelection (store), factory);
             
-            // Copy button
-            var copy_button = new Gtk.Button.from_icon_name ("edit-copy-symbolic") {
-                valign = Gtk.Align.CENTER,
-                halign = Gtk.Align.CENTER,
-                tooltip_text = "Copy to clipboard"
+            var scrolled_window = new Gtk.ScrolledWindow () {
+                child = list_view,
+                hscrollbar_policy = Gtk.PolicyType.NEVER,
+                propagate_natural_height = true,
+                max_content_height = RECORD_LIST_VIEW_MAX_HEIGHT
             };
-            copy_button.add_css_class ("flat");
-            copy_button.clicked.connect (() => {
-                copy_to_clipboard (record.get_copyable_value ());
-            });
+            scrolled_window.add_css_class ("card");
             
-            row.add_suffix (value_label);
-            row.add_suffix (copy_button);
-            row.activatable_widget = copy_button;
-            
-            return row;
+            return scrolled_window;
+        }
+        
+        private RecordTypeInfo? get_record_type_info (DnsRecord record) {
+            if (dns_presets == null) {
+                return null;
+            }
+            return dns_presets.get_record_type_info (record.record_type_name);
         }
         
         private void add_query_statistics (QueryResult result) {
@@ -536,7 +538,7 @@ namespace Digger {
             count_row.add_suffix (count_label);
             stats_group.add (count_row);
             
-            content_box.append (stats_group);
+            content_root.append (stats_group);
         }
         
         private void copy_to_clipboard (string text) {
@@ -578,7 +580,7 @@ namespace Digger {
                     title = "Registrar",
                     subtitle = whois.registrar
                 };
-                var copy_button = new Gtk.Button.from_icon_name ("edit-copy-symbolic") {
+                var copy_button = new Gtk.Button.from_icon_name (COPY_ICON_NAME) {
                     valign = Gtk.Align.CENTER,
                     tooltip_text = "Copy to clipboard"
                 };
@@ -629,7 +631,7 @@ namespace Digger {
                         title = ns
                     };
                     ns_row.add_css_class ("monospace");
-                    var copy_button = new Gtk.Button.from_icon_name ("edit-copy-symbolic") {
+                    var copy_button = new Gtk.Button.from_icon_name (COPY_ICON_NAME) {
                         valign = Gtk.Align.CENTER,
                         tooltip_text = "Copy to clipboard"
                     };
@@ -683,7 +685,7 @@ namespace Digger {
                 whois_group.add (no_data_row);
             }
 
-            content_box.append (whois_group);
+            content_root.append (whois_group);
         }
 
         private void add_dnssec_validation (string domain) {
@@ -706,7 +708,7 @@ namespace Digger {
             status_row.add_suffix (spinner);
 
             dnssec_group.add (status_row);
-            content_box.append (dnssec_group);
+            content_root.append (dnssec_group);
 
             var validator = new DnssecValidator ();
             validator.validate_domain.begin (domain, null, (obj, res) => {
@@ -773,6 +775,7 @@ namespace Digger {
 
         public void clear_results () {
             current_result = null;
+            stop_progress_pulse ();
             progress_bar.visible = false;
 
             // Hide action buttons when clearing results
@@ -785,29 +788,152 @@ namespace Digger {
         }
         
         private void clear_content () {
-            var child = content_box.get_first_child ();
-            while (child != null) {
-                var next = child.get_next_sibling ();
-                content_box.remove (child);
-                child = next;
-            }
-        }
-        private string format_rrsig_date (string? date_str) {
-            if (date_str == null || date_str.length < 14) return date_str ?? "";
-            
-            // Format: YYYYMMDDHHmmss
-            // Return: YYYY-MM-DD HH:mm:ss
-            try {
-                string year = date_str.substring (0, 4);
-                string month = date_str.substring (4, 2);
-                string day = date_str.substring (6, 2);
-                string hour = date_str.substring (8, 2);
-                string minute = date_str.substring (10, 2);
-                string second = date_str.substring (12, 2);
+            // Detach record rows so the next result can rebind them instead of building new ones
+            foreach (var row in active_rows) {
+                var group = row.get_ancestor (typeof (Adw.PreferencesGroup)) as Adw.PreferencesGroup;
+                if (group != null) {
+                    group.remove (row);
+                }
+                if (row_pool.size < ROW_POOL_LIMIT) {
+                    row_pool.add (row);
+                }
+            }
+            active_rows.clear ();
+            
+            // Swap in a fresh root instead of removing each child one at a time
+            if (content_root != null) {
+                content_box.remove (content_root);
+            }
+            content_root = new Gtk.Box (Gtk.Orientation.VERTICAL, 12);
+            content_box.append (content_root);
+        }
+
+        /**
+         * Result row for a single DNS record. The child widgets are created once
+         * and bind() fills them in, so list views can recycle rows between records.
+         */
+        private class RecordRow : Adw.ActionRow {
+            private Gtk.Image type_icon;
+            private Gtk.Label type_badge;
+            private Gtk.Label ttl_label;
+            private Gtk.Label value_label;
+            private Gtk.Button copy_button;
+            private string? badge_style_class = null;
+            private DnsRecord? record = null;
+            
+            public signal void copy_requested (string text);
+            
+            construct {
+                // Record type icon, shown when type information is available
+                type_icon = new Gtk.Image () {
+                    pixel_size = 16,
+                    visible = false
+                };
+                
+                // Colored record type badge
+                type_badge = new Gtk.Label (null) {
+                    halign = Gtk.Align.CENTER,
+                    valign = Gtk.Align.CENTER,
+                    width_request = 60
+                };
+                type_badge.add_css_class ("pill");
                 
-                return @"$year-$month-$day $hour:$minute:$second";
-            } catch (Error e) {
-                return date_str;
+                ttl_label = new Gtk.Label (null) {
+                    margin_end = 6,
+                    visible = false
+                };
+                ttl_label.add_css_class ("caption");
+                ttl_label.add_css_class ("dim-label");
+                
+                // Value display
+                value_label = new Gtk.Label (null) {
+                    halign = Gtk.Align.END,
+                    selectable = true,
+                    wrap = false,
+                    ellipsize = Pango.EllipsizeMode.END,
+                    max_width_chars = 80
+                };
+                value_label.add_css_class ("monospace");
+                
+                // Copy button
+                copy_button = new Gtk.Button.from_icon_name (COPY_ICON_NAME) {
+                    valign = Gtk.Align.CENTER,
+                    halign = Gtk.Align.CENTER,
+                    tooltip_text = "Copy to clipboard"
+                };
+                copy_button.add_css_class ("flat");
+                copy_button.clicked.connect (() => {
+                    if (record != null) {
+                        copy_requested (record.get_copyable_value ());
+                    }
+                });
+                
+                add_suffix (ttl_label);
+                add_prefix (type_icon);
+                add_prefix (type_badge);
+                add_suffix (value_label);
+                add_suffix (copy_button);
+                activatable_widget = copy_button;
+            }
+            
+            public void bind (DnsRecord record, string style_class, RecordTypeInfo? type_info,
+                              bool ttl_prominent, bool detailed_ttl) {
+                this.record = record;
+                
+                if (badge_style_class != style_class) {
+                    if (badge_style_class != null) {
+                        type_badge.remove_css_class (badge_style_class);
+                    }
+                    type_badge.add_css_class (style_class);
+                    badge_style_class = style_class;
+                }
+                type_badge.label = record.record_type_name;
+                
+                // Record name and TTL
+                title = record.name;
+                
+                if (record.record_type == RecordType.RRSIG && record.rrsig_type_covered != null) {
+                    string exp_date = format_rrsig_date (record.rrsig_expiration);
+                    subtitle = @"Covers $(record.rrsig_type_covered) • Expires $exp_date • Tag $(record.rrsig_key_tag) • Alg $(record.rrsig_algorithm)";
+                } else if (ttl_prominent) {
+                    subtitle = @"TTL: $(record.ttl)s";
+                } else {
+                    subtitle = record.value;
+                }
+                
+                ttl_label.visible = detailed_ttl;
+                if (detailed_ttl) {
+                    ttl_label.label = @"TTL: $(record.ttl)s";
+                }
+                
+                type_icon.visible = type_info != null;
+                if (type_info != null) {
+                    type_icon.icon_name = type_info.icon;
+                    tooltip_text = type_info.get_tooltip_text ();
+                } else {
+                    tooltip_text = null;
+                }
+                
+                value_label.label = record.get_display_value ();
+            }
+            
+            private static string format_rrsig_date (string? date_str) {
+                if (date_str == null || date_str.length < 14) return date_str ?? "";
+                
+                // Format: YYYYMMDDHHmmss
+                // Return: YYYY-MM-DD HH:mm:ss
+                try {
+                    string year = date_str.substring (0, 4);
+                    string month = date_str.substring (4, 2);
+                    string day = date_str.substring (6, 2);
+                    string hour = date_str.substring (8, 2);
+                    string minute = date_str.substring (10, 2);
+                    string second = date_str.substring (12, 2);
+                    
+                    return @"$year-$month-$day $hour:$minute:$second";
+                } catch (Error e) {
+                    return date_str;
+                }
             }
         }
     }